@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
 from pathlib import Path
 from typing import Callable
 
@@ -11,6 +12,12 @@ from langformer.prompting.manager import PromptManager
 from langformer.prompting.registry import register_engine, register_renderer
 from langformer.prompting.types import PromptTaskSpec
 
+_TEMPLATES_ROOT = Path("langformer/prompting/templates")
+_TEMPLATE_ITEMS: tuple[tuple[str, str], ...] = (
+    ("transpile_initial", "transpile.j2"),
+    ("transpile_refine", "refine.j2"),
+)
+
 
 def build_demo_spec() -> PromptTaskSpec:
     """Create a PromptTaskSpec shared by the demo and tests."""
@@ -56,21 +63,32 @@ def make_example_module_factory() -> Callable[[], object]:
     return DemoModule
 
 
+@lru_cache(maxsize=1)
+def _get_prompt_manager(root: str) -> PromptManager:
+    # Templates are static for the demo, so skip Jinja's per-lookup mtime
+    # checks and keep compiled templates for the life of the process.
+    return PromptManager(Path(root), auto_reload=False)
+
+
+@lru_cache(maxsize=None)
+def _get_renderer(
+    root: str, template_items: tuple[tuple[str, str], ...]
+) -> JinjaPromptRenderer:
+    return JinjaPromptRenderer(
+        _get_prompt_manager(root), template_map=dict(template_items)
+    )
+
+
+def _renderer_factory() -> JinjaPromptRenderer:
+    return _get_renderer(str(_TEMPLATES_ROOT), _TEMPLATE_ITEMS)
+
+
 def register_prompt_layer_backends(
     *,
     module_factory: Callable[[], object] | None = None,
 ) -> None:
     """Register renderers + DSPy engine for the demo kinds."""
 
-    prompt_manager = PromptManager(Path("langformer/prompting/templates"))
-    template_map = {
-        "transpile_initial": "transpile.j2",
-        "transpile_refine": "refine.j2",
-    }
-
-    def _renderer_factory() -> JinjaPromptRenderer:
-        return JinjaPromptRenderer(prompt_manager, template_map=template_map)
-
     register_renderer("transpile_initial", _renderer_factory)
     register_renderer("transpile_refine", _renderer_factory)
     register_engine(
@@ -1,6 +1,26 @@
 """DSPy-powered Python→Ruby transpiler example."""
 
-from examples.dspy_py2rb_transpiler.agent import Py2RbDSPyTranspilerAgent
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
 from examples.dspy_py2rb_transpiler.oracle import register_oracle
 
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    from examples.dspy_py2rb_transpiler.agent import (
+        Py2RbDSPyTranspilerAgent,
+    )
+
 __all__ = ["Py2RbDSPyTranspilerAgent", "register_oracle"]
+
+
+def __getattr__(name: str) -> Any:
+    # The agent pulls in DSPy (and litellm behind it); only import it when
+    # the agent is actually requested so oracle-only imports stay cheap.
+    if name == "Py2RbDSPyTranspilerAgent":
+        from examples.dspy_py2rb_transpiler.agent import (
+            Py2RbDSPyTranspilerAgent,
+        )
+
+        return Py2RbDSPyTranspilerAgent
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
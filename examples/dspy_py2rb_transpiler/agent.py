@@ -3,11 +3,14 @@
 from __future__ import annotations
 
 import ast
+import hashlib
 import json
 import logging
 import re
 
-from types import SimpleNamespace
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
 from typing import Any, Callable, Dict, List, Optional
 
 try:
@@ -21,6 +24,7 @@ except ImportError as exc:  # pragma: no cover - defensive
 from examples.dspy_py2rb_transpiler.dspy_components import (
     DSPyFeedbackOptimizer,
     build_py2rb_program,
+    format_requirements,
 )
 from langformer.agents.base import LLMConfig
 from langformer.agents.transpiler import (
@@ -46,45 +50,122 @@ DEFAULT_STYLE_GUIDE: tuple[str, ...] = (
     "(lists → Arrays, dicts → Hashes, booleans → true/false).",
 )
 
+_NAMESPACE_SPLIT_RE = re.compile(r"[^0-9a-zA-Z]+")
+
+
+@dataclass(slots=True)
+class _LFMessage:
+    role: str
+    content: str
+
+
+@dataclass(slots=True)
+class _LFChoice:
+    index: int
+    message: _LFMessage
+    finish_reason: str
+
+
+@dataclass(slots=True)
+class _LFResponse:
+    """OpenAI-shaped completion carrying only the fields DSPy reads."""
+
+    id: str
+    model: str
+    usage: Dict[str, int]
+    choices: tuple[_LFChoice, ...]
+
 
 class LangformerDSPyLM(dspy.BaseLM):  # type: ignore[misc]
     """Wrap Langformer providers so DSPy modules can consume them."""
 
-    def __init__(self, provider, *, temperature: float = 0.2) -> None:
+    def __init__(
+        self,
+        provider,
+        *,
+        temperature: float = 0.2,
+        cache_dir: Path | None = None,
+    ) -> None:
         super().__init__(model="langformer/dspy", temperature=temperature)
         self._provider = provider
+        self._cache_dir = Path(cache_dir) if cache_dir is not None else None
+        # Part of every disk key, so a cache_dir reused after switching
+        # provider or model never serves another model's completions.
+        self._cache_namespace = _provider_identity(provider).encode("utf-8")
+        if self._cache_dir is not None:
+            self._cache_dir.mkdir(parents=True, exist_ok=True)
 
     def forward(self, prompt=None, messages=None, **kwargs):  # type: ignore[override]
         if messages:
-            user_prompt = "\n".join(
-                msg.get("content", "") for msg in messages if isinstance(msg, dict)
-            )
+            contents = [
+                msg["content"]
+                for msg in messages
+                if isinstance(msg, dict) and "content" in msg
+            ]
+            if len(contents) == 1:
+                user_prompt = contents[0]
+            else:
+                user_prompt = "\n".join(contents)
         else:
             user_prompt = prompt or ""
         temperature = kwargs.get("temperature", self.kwargs.get("temperature"))
-        text = self._provider.generate(
-            user_prompt,
-            metadata={"source": "dspy"},
-            temperature=temperature,
-        )
-        usage = {
-            "prompt_tokens": len(user_prompt),
-            "completion_tokens": len(text),
-            "total_tokens": len(user_prompt) + len(text),
-        }
-        message = SimpleNamespace(role="assistant", content=text)
-        choice = SimpleNamespace(
-            index=0,
-            message=message,
-            finish_reason="stop",
-        )
-        return SimpleNamespace(
+        cache_path = self._cache_path(user_prompt, temperature)
+        if cache_path is not None and cache_path.exists():
+            text = cache_path.read_text(encoding="utf-8")
+        else:
+            text = self._provider.generate(
+                user_prompt,
+                metadata={"source": "dspy"},
+                temperature=temperature,
+            )
+            if cache_path is not None:
+                tmp_path = cache_path.with_suffix(".tmp")
+                tmp_path.write_text(text, encoding="utf-8")
+                tmp_path.replace(cache_path)
+        prompt_tokens = len(user_prompt)
+        completion_tokens = len(text)
+        return _LFResponse(
             id="langformer-dspy",
             model="langformer/dspy",
-            usage=usage,
-            choices=[choice],
+            usage={
+                "prompt_tokens": prompt_tokens,
+                "completion_tokens": completion_tokens,
+                "total_tokens": prompt_tokens + completion_tokens,
+            },
+            choices=(
+                _LFChoice(
+                    index=0,
+                    message=_LFMessage(role="assistant", content=text),
+                    finish_reason="stop",
+                ),
+            ),
         )
 
+    def _cache_path(
+        self, user_prompt: str, temperature: Any
+    ) -> Path | None:
+        if self._cache_dir is None:
+            return None
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(self._cache_namespace)
+        digest.update(b"\0")
+        digest.update(repr(temperature).encode("utf-8"))
+        digest.update(b"\0")
+        digest.update(user_prompt.encode("utf-8"))
+        return self._cache_dir / f"{digest.hexdigest()}.txt"
+
+
+def _provider_identity(provider: Any) -> str:
+    parts = [type(provider)]
+    inner = getattr(provider, "_provider", None)
+    if inner is not None:
+        parts.append(type(inner))
+    names = [f"{cls.__module__}.{cls.__qualname__}" for cls in parts]
+    model = getattr(provider, "model_name", None) or getattr(
+        provider, "_model_name", None
+    )
+    return "|".join([*names, str(model or "")])
+
 
 class Py2RbDSPyTranspilerAgent(TranspilerAgent):
     """Transpiler that routes prompt specs through a DSPy program + optimizer."""
@@ -103,6 +184,7 @@ class Py2RbDSPyTranspilerAgent(TranspilerAgent):
         event_adapter_factory=None,
         prompt_renderer=None,
         prompt_template_map=None,
+        lm_cache_dir: Path | None = None,
     ) -> None:
         self._source_plugin = source_plugin
         self._target_plugin = target_plugin
@@ -115,9 +197,11 @@ class Py2RbDSPyTranspilerAgent(TranspilerAgent):
         self._program_factory = self._optimizer.compile_program(
             self._module_factory
         )
+        self._program = self._program_factory()
         self._max_retries = max(1, max_retries)
         self._event_factory = event_adapter_factory
         self._logger = logging.getLogger(__name__)
+        self._lm_cache_dir = lm_cache_dir
         self._configure_dspy()
 
     def _configure_dspy(self) -> None:
@@ -128,6 +212,7 @@ class Py2RbDSPyTranspilerAgent(TranspilerAgent):
                     temperature=self._llm_config.provider.__dict__.get(
                         "temperature", 0.2
                     ),
+                    cache_dir=self._lm_cache_dir,
                 )
             )
         except Exception as exc:  # pragma: no cover - defensive
@@ -147,6 +232,13 @@ class Py2RbDSPyTranspilerAgent(TranspilerAgent):
         target_path = ctx.layout.target_path(unit.id)
         feedback: Optional[str] = None
         previous_code: Optional[str] = None
+        api_contract = _describe_python_api(unit.source_code or "")
+        module_name = _derive_ruby_namespace(unit, ctx)
+        base_style = _build_style_guide(ctx, module_name)
+        base_style_text = "\n".join(base_style)
+        requirement_outline = _build_requirement_outline(ctx)
+        base_requirements_text = format_requirements(requirement_outline)
+        fill_cache: Dict[Any, Dict[str, object]] = {}
         for attempt in range(1, self._max_retries + 1):
             if (
                 cancel_event is not None
@@ -161,19 +253,15 @@ class Py2RbDSPyTranspilerAgent(TranspilerAgent):
                 feedback,
                 attempt,
                 previous_code,
+                fill_cache,
             )
-            module_name = _derive_ruby_namespace(unit, ctx)
             spec.metadata["ruby_namespace"] = module_name
-            spec.metadata.setdefault(
-                "style_guide", _build_style_guide(ctx, module_name)
-            )
-            spec.metadata.setdefault(
-                "verifier_requirements",
-                _build_requirement_outline(ctx),
-            )
-            spec.metadata["api_contract"] = _describe_python_api(
-                unit.source_code or ""
-            )
+            spec.metadata.setdefault("style_guide", base_style)
+            outline_copy = {
+                key: list(lines) for key, lines in requirement_outline.items()
+            }
+            spec.metadata.setdefault("verifier_requirements", outline_copy)
+            spec.metadata["api_contract"] = api_contract
             overrides = self._optimizer.build_overrides(unit.id)
             style_overrides = None
             requirement_overrides: Dict[str, Any] | None = None
@@ -184,10 +272,10 @@ class Py2RbDSPyTranspilerAgent(TranspilerAgent):
                 )
                 spec.metadata = _merge_metadata(spec.metadata, overrides)
             if style_overrides:
-                spec.metadata.setdefault(
-                    "style_guide", _build_style_guide(ctx, module_name)
-                )
-                spec.metadata["style_guide"].extend(style_overrides)
+                spec.metadata["style_guide"] = [
+                    *spec.metadata["style_guide"],
+                    *style_overrides,
+                ]
             if requirement_overrides:
                 base_requirements = spec.metadata.setdefault(
                     "verifier_requirements", {}
@@ -195,9 +283,20 @@ class Py2RbDSPyTranspilerAgent(TranspilerAgent):
                 spec.metadata["verifier_requirements"] = _merge_metadata(
                     base_requirements, requirement_overrides
                 )
+            # Reuse the pre-rendered texts unless this attempt changed them.
+            style_text = (
+                base_style_text
+                if spec.metadata["style_guide"] is base_style
+                else None
+            )
+            requirements_text = (
+                base_requirements_text
+                if not requirement_overrides
+                and spec.metadata["verifier_requirements"] is outline_copy
+                else None
+            )
 
-            program = self._program_factory()
-            result = program(
+            result = self._program(
                 source_code=unit.source_code or "",
                 unit_metadata={
                     "api_contract": spec.metadata.get("api_contract", ""),
@@ -207,6 +306,8 @@ class Py2RbDSPyTranspilerAgent(TranspilerAgent):
                         "verifier_requirements", {}
                     ),
                     "ruby_namespace": spec.metadata.get("ruby_namespace", ""),
+                    "style_text": style_text,
+                    "requirements_text": requirements_text,
                 },
                 verification_feedback=spec.metadata.get(
                     "verification_feedback"
@@ -236,6 +337,8 @@ class Py2RbDSPyTranspilerAgent(TranspilerAgent):
             )
             if verification.passed:
                 return candidate
+            # Prompt text keeps stdlib formatting so LM caches and compiled
+            # demos stay valid; orjson is only used for internal keys.
             feedback = json.dumps(verification_note)
         raise RuntimeError(
             f"DSPy agent failed to transpile unit {unit.id} within retry budget"
@@ -245,16 +348,17 @@ class Py2RbDSPyTranspilerAgent(TranspilerAgent):
 def _merge_metadata(
     base: Dict[str, Any], overrides: Dict[str, Any]
 ) -> Dict[str, Any]:
-    for key, value in overrides.items():
-        if (
-            isinstance(value, dict)
-            and isinstance(base.get(key), dict)
-        ):
-            base[key] = _merge_metadata(
-                base.get(key, {}).copy(), value
-            )
-        else:
-            base[key] = value
+    # Spec metadata is rebuilt on every attempt, so nested dicts are merged
+    # in place rather than copied at each level of overlap.
+    stack = [(base, overrides)]
+    while stack:
+        target, updates = stack.pop()
+        for key, value in updates.items():
+            current = target.get(key)
+            if isinstance(value, dict) and isinstance(current, dict):
+                stack.append((current, value))
+            else:
+                target[key] = value
     return base
 
 
@@ -262,29 +366,30 @@ def _build_style_guide(
     ctx: IntegrationContext, module_name: str
 ) -> List[str]:
     feature_spec = ctx.feature_spec or {}
-    style = list(DEFAULT_STYLE_GUIDE)
+    style = [*DEFAULT_STYLE_GUIDE]
     if module_name:
         style.append(
             f"Wrap the translated helpers inside a Ruby module or class "
             f"named `{module_name}`."
         )
     extra = feature_spec.get("style_guide")
-    if isinstance(extra, (list, tuple)):
-        style.extend(str(entry) for entry in extra if entry)
+    # One type check per call; a bare string would otherwise be iterated
+    # character by character.
+    if extra and isinstance(extra, (list, tuple)):
+        style += [str(entry) for entry in extra if entry]
     return style
 
 
 def _build_requirement_outline(ctx: IntegrationContext) -> Dict[str, Any]:
     feature_spec = ctx.feature_spec or {}
     outline: Dict[str, List[str]] = {}
-    for case in feature_spec.get("verification_cases") or []:
-        try:
-            payload = json.dumps(case, sort_keys=True)
-        except TypeError:
-            payload = str(case)
-        outline.setdefault("cases", []).append(
-            f"Ruby results must match the Python implementation for input {payload}."
-        )
+    cases = feature_spec.get("verification_cases") or []
+    if cases:
+        outline["cases"] = [
+            "Ruby results must match the Python implementation for input "
+            f"{_canonical_case(case)}."
+            for case in cases
+        ]
     for test_path in feature_spec.get("ruby_tests") or []:
         outline.setdefault("ruby_tests", []).append(
             f"ruby {test_path} must pass after requiring the generated file."
@@ -297,19 +402,30 @@ def _build_requirement_outline(ctx: IntegrationContext) -> Dict[str, Any]:
     return outline
 
 
+def _canonical_case(case: Any) -> str:
+    try:
+        return json.dumps(case, sort_keys=True)
+    except TypeError:
+        return str(case)
+
+
 def _derive_ruby_namespace(unit: TranspileUnit, ctx: IntegrationContext) -> str:
     feature_spec = ctx.feature_spec or {}
     explicit = feature_spec.get("ruby_namespace")
     if isinstance(explicit, str) and explicit.strip():
         return explicit.strip()
-    slug = unit.id or "transpiled_module"
-    parts = re.split(r"[^0-9a-zA-Z]+", slug)
-    tokens = [token for token in parts if token]
+    return _namespace_from_slug(unit.id or "transpiled_module")
+
+
+@lru_cache(maxsize=1024)
+def _namespace_from_slug(slug: str) -> str:
+    tokens = [token for token in _NAMESPACE_SPLIT_RE.split(slug) if token]
     if not tokens:
         return "TranspiledModule"
-    return "".join(token.capitalize() for token in tokens)
+    return "".join(map(str.capitalize, tokens))
 
 
+@lru_cache(maxsize=512)
 def _describe_python_api(source: str) -> str:
     try:
         tree = ast.parse(source)
@@ -318,17 +434,31 @@ def _describe_python_api(source: str) -> str:
     lines: list[str] = []
     for node in tree.body:
         if isinstance(node, ast.FunctionDef):
-            params = [arg.arg for arg in node.args.args]
-            doc = ast.get_docstring(node) or ""
-            doc_line = doc.splitlines()[0] if doc else ""
-            signature = f"{node.name}({', '.join(params)})"
+            params = ", ".join(arg.arg for arg in node.args.args)
+            signature = f"{node.name}({params})"
+            doc_line = _first_doc_line(node)
             if doc_line:
                 lines.append(f"{signature}: {doc_line}")
             else:
                 lines.append(signature)
         elif isinstance(node, ast.ClassDef):
-            doc = ast.get_docstring(node) or ""
-            doc_line = doc.splitlines()[0] if doc else ""
-            header = f"class {node.name}"
-            lines.append(f"{header}: {doc_line or 'no docstring provided.'}")
+            doc_line = _first_doc_line(node) or "no docstring provided."
+            lines.append(f"class {node.name}: {doc_line}")
     return "\n".join(lines) if lines else "Module defines no public functions."
+
+
+def _first_doc_line(node: ast.FunctionDef | ast.ClassDef) -> str:
+    # Read the first docstring line straight off the AST instead of going
+    # through ast.get_docstring, which cleans the whole docstring first.
+    if not node.body:
+        return ""
+    first = node.body[0]
+    if not (
+        isinstance(first, ast.Expr)
+        and isinstance(first.value, ast.Constant)
+        and isinstance(first.value.value, str)
+    ):
+        return ""
+    text = first.value.value.lstrip()
+    end = text.find("\n")
+    return text if end < 0 else text[:end]
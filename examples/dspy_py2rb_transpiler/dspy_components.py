@@ -2,9 +2,13 @@
 
 from __future__ import annotations
 
+import hashlib
+import io
 import json
 
-from typing import Any, Callable, Dict, List, Sequence
+from collections import deque
+from pathlib import Path
+from typing import Any, Callable, Deque, Dict, List, Sequence, Tuple
 
 from langformer.artifacts import ArtifactManager
 from langformer.constants import ARTIFACT_STAGE_TRANSPILER
@@ -17,6 +21,11 @@ except ImportError as exc:  # pragma: no cover - fail loudly
         "Install it via `pip install dspy`."
     ) from exc
 
+try:  # pragma: no cover - optional dependency
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
 
 class ContextSummarySignature(dspy.Signature):  # type: ignore[misc]
     source_code = dspy.InputField(
@@ -75,11 +84,24 @@ class Py2RbProgram(dspy.Module):  # type: ignore[misc]
             api_contract=metadata.get("api_contract", ""),
         )
         summary_text = getattr(summary_result, "summary", source_code)
-        style_text = "\n".join(metadata.get("style_guide", []))
-        requirements_text = _format_requirements(
-            metadata.get("verifier_requirements")
+        style_text = metadata.get("style_text")
+        if style_text is None:
+            style_text = "\n".join(metadata.get("style_guide", []))
+        requirements_text = metadata.get("requirements_text")
+        if requirements_text is None:
+            verifier_requirements = metadata.get("verifier_requirements")
+            requirements_text = (
+                format_requirements(verifier_requirements)
+                if verifier_requirements
+                else ""
+            )
+        feedback_text = (
+            _format_feedback(verification_feedback)
+            if verification_feedback
+            else ""
         )
-        feedback_text = _format_feedback(verification_feedback)
+        # First attempts go through the same (compiled) predictor with empty
+        # requirement and feedback fields.
         return self.transpile(
             python_summary=summary_text,
             source_code=source_code,
@@ -90,8 +112,16 @@ class Py2RbProgram(dspy.Module):  # type: ignore[misc]
         )
 
 
+_PROGRAM_TEMPLATE: Py2RbProgram | None = None
+
+
 def build_py2rb_program() -> Py2RbProgram:
-    return Py2RbProgram()
+    # Signature parsing happens once for the template; each agent gets an
+    # isolated deep copy so predictor state never leaks between agents.
+    global _PROGRAM_TEMPLATE
+    if _PROGRAM_TEMPLATE is None:
+        _PROGRAM_TEMPLATE = Py2RbProgram()
+    return _PROGRAM_TEMPLATE.deepcopy()
 
 
 class DSPyFeedbackOptimizer:
@@ -103,9 +133,14 @@ class DSPyFeedbackOptimizer:
         artifact_manager: ArtifactManager | None = None,
         compile_fn: Callable[[Callable[[], dspy.Module]], Callable[[], dspy.Module]]
         | None = None,
+        history_limit: int = 8,
     ) -> None:
         self._artifact_manager = artifact_manager
-        self._history: Dict[str, List[Dict[str, Any]]] = {}
+        # build_overrides only looks at the most recent attempts, so keep a
+        # bounded window per unit instead of the full retry history.
+        self._history: Dict[str, Deque[Dict[str, Any]]] = {}
+        self._history_limit = max(1, history_limit)
+        self._last_artifact: Dict[str, Tuple[bytes, Path, int]] = {}
         self._compile_fn = compile_fn
 
     def compile_program(
@@ -127,20 +162,41 @@ class DSPyFeedbackOptimizer:
             "failures": list(verification_note.get("failures") or []),
             "details": verification_note,
         }
-        self._history.setdefault(unit_id, []).append(entry)
+        history = self._history.get(unit_id)
+        if history is None:
+            history = deque(maxlen=self._history_limit)
+            self._history[unit_id] = history
+        history.append(entry)
         if not self._artifact_manager:
             return
-        stage_dir = self._artifact_manager.stage_dir(
-            ARTIFACT_STAGE_TRANSPILER, unit_id
-        )
-        payload = json.dumps(entry, indent=2)
-        artifact_path = stage_dir / f"dspy_feedback_{attempt:02d}.json"
-        artifact_path.write_text(payload, encoding="utf-8")
+        comparable = {
+            key: value for key, value in entry.items() if key != "attempt"
+        }
+        digest = hashlib.blake2b(
+            dump_json_bytes(comparable, sort_keys=True), digest_size=16
+        ).digest()
+        metadata: Dict[str, Any] = {
+            "attempt": attempt,
+            "passed": entry["passed"],
+        }
+        previous = self._last_artifact.get(unit_id)
+        if previous is not None and previous[0] == digest:
+            # Same verifier outcome as the last attempt: point at the
+            # existing artifact instead of writing an identical file.
+            _, artifact_path, previous_attempt = previous
+            metadata["duplicate_of"] = previous_attempt
+        else:
+            stage_dir = self._artifact_manager.stage_dir(
+                ARTIFACT_STAGE_TRANSPILER, unit_id
+            )
+            artifact_path = stage_dir / f"dspy_feedback_{attempt:02d}.json"
+            artifact_path.write_bytes(dump_json_bytes(entry, indent=True))
+            self._last_artifact[unit_id] = (digest, artifact_path, attempt)
         self._artifact_manager.register(
             ARTIFACT_STAGE_TRANSPILER,
             unit_id,
             artifact_path,
-            metadata={"attempt": attempt, "passed": entry["passed"]},
+            metadata=metadata,
         )
 
     def build_overrides(self, unit_id: str) -> Dict[str, Any]:
@@ -151,85 +207,118 @@ class DSPyFeedbackOptimizer:
         overrides: Dict[str, Any] = {}
         hints: List[str] = []
         for entry in reversed(history):
-            for failure in entry.get("failures", []):
-                hints.append(failure)
+            hints.extend(entry.get("failures") or ())
             if hints:
                 break
         if hints:
             overrides["hints"] = hints
         details = latest["details"]
         overrides["verification_feedback"] = [details]
-        style_hints = _style_hints_from_feedback(details)
+        style_hints, requirement_summary = _extract_feedback(details)
         if style_hints:
             overrides["style_guide"] = style_hints
-        requirement_summary = _requirements_from_feedback(details)
         if requirement_summary:
             overrides["verifier_requirements"] = requirement_summary
         return overrides
 
 
+def dump_json_bytes(
+    payload: Any, *, indent: bool = False, sort_keys: bool = False
+) -> bytes:
+    """Serialize ``payload`` to UTF-8 JSON, preferring orjson if present."""
+
+    if orjson is not None:
+        option = 0
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        try:
+            return orjson.dumps(payload, option=option)
+        except TypeError:
+            # orjson rejects some inputs stdlib json accepts (e.g. int keys).
+            pass
+    return json.dumps(
+        payload,
+        indent=2 if indent else None,
+        separators=None if indent else (",", ":"),
+        sort_keys=sort_keys,
+        ensure_ascii=False,
+    ).encode("utf-8")
+
+
 def _format_feedback(
     entries: Sequence[Dict[str, Any]] | None,
 ) -> str:
     if not entries:
         return ""
-    blocks: List[str] = []
-    for entry in entries:
-        lines: List[str] = []
-        if entry.get("failures"):
-            lines.append("Failures: " + "; ".join(entry["failures"]))
-        mismatch = entry.get("mismatch")
-        if mismatch:
-            case = mismatch.get("case")
-            python = mismatch.get("python")
-            ruby = mismatch.get("ruby")
-            lines.append(
-                "Mismatch case: "
-                f"input={case}, python={python}, ruby={ruby}"
+    buf = io.StringIO()
+    for index, entry in enumerate(entries):
+        if index:
+            buf.write("\n\n")
+        _write_feedback_entry(buf, entry)
+    return buf.getvalue()
+
+
+def _write_feedback_entry(buf: io.StringIO, entry: Dict[str, Any]) -> None:
+    start = buf.tell()
+    failures = entry.get("failures")
+    if failures:
+        _write_line(buf, start, "Failures: " + "; ".join(failures))
+    mismatch = entry.get("mismatch")
+    if mismatch:
+        case = mismatch.get("case")
+        python = mismatch.get("python")
+        ruby = mismatch.get("ruby")
+        _write_line(
+            buf,
+            start,
+            f"Mismatch case: input={case}, python={python}, ruby={ruby}",
+        )
+    for test in entry.get("ruby_tests") or []:
+        if test.get("status") != "passed":
+            _write_line(
+                buf,
+                start,
+                f"Ruby test {test.get('name')} failed: "
+                f"{test.get('message')}",
             )
-        tests = entry.get("ruby_tests") or []
-        failed = [
-            test for test in tests if test.get("status") != "passed"
-        ]
-        if failed:
-            for test in failed:
-                lines.append(
-                    f"Ruby test {test.get('name')} failed: "
-                    f"{test.get('message')}"
-                )
-        syntax = entry.get("syntax")
-        if syntax and not syntax.get("passed"):
-            lines.append(f"Syntax error: {syntax.get('error')}")
-        if not lines and entry:
-            lines.append(json.dumps(entry, indent=2, sort_keys=True))
-        blocks.append("\n".join(lines))
-    return "\n\n".join(blocks)
-
-
-def _format_requirements(raw: Dict[str, Any] | None) -> str:
+    syntax = entry.get("syntax")
+    if syntax and not syntax.get("passed"):
+        _write_line(buf, start, f"Syntax error: {syntax.get('error')}")
+    if buf.tell() == start and entry:
+        buf.write(json.dumps(entry, indent=2, sort_keys=True))
+
+
+def format_requirements(raw: Dict[str, Any] | None) -> str:
     if not raw:
         return ""
-    lines: List[str] = []
-    cases = raw.get("cases") or []
-    if cases:
-        lines.append("Verification cases:")
-        for case in cases:
-            lines.append(f"- {case}")
-    tests = raw.get("ruby_tests") or []
-    if tests:
-        lines.append("Ruby tests to satisfy:")
-        for test in tests:
-            lines.append(f"- {test}")
-    notes = raw.get("notes") or []
-    if notes:
-        lines.append("Additional notes:")
-        for note in notes:
-            lines.append(f"- {note}")
-    return "\n".join(lines)
-
-
-def _style_hints_from_feedback(details: Dict[str, Any]) -> List[str]:
+    buf = io.StringIO()
+    for key, heading in (
+        ("cases", "Verification cases:"),
+        ("ruby_tests", "Ruby tests to satisfy:"),
+        ("notes", "Additional notes:"),
+    ):
+        items = raw.get(key) or []
+        if not items:
+            continue
+        _write_line(buf, 0, heading)
+        for item in items:
+            buf.write(f"\n- {item}")
+    return buf.getvalue()
+
+
+def _write_line(buf: io.StringIO, block_start: int, text: str) -> None:
+    if buf.tell() > block_start:
+        buf.write("\n")
+    buf.write(text)
+
+
+def _extract_feedback(
+    details: Dict[str, Any],
+) -> Tuple[List[str], Dict[str, Any]]:
     hints: List[str] = []
+    requirements: Dict[str, List[str]] = {}
     syntax = details.get("syntax")
     if syntax and not syntax.get("passed"):
         hints.append(
@@ -243,38 +332,32 @@ def _style_hints_from_feedback(details: Dict[str, Any]) -> List[str]:
             f"Ensure the Ruby implementation produces the same scaled values "
             f"and report as Python for {case}."
         )
-    ruby_tests = details.get("ruby_tests") or []
-    for test in ruby_tests:
-        if test.get("status") != "passed":
-            hints.append(
-                f"Fix {test.get('name')}: {test.get('message')}"
-            )
-    return hints
-
-
-def _requirements_from_feedback(details: Dict[str, Any]) -> Dict[str, Any]:
-    requirements: Dict[str, List[str]] = {}
     cases = details.get("cases") or []
     python_outputs = details.get("python") or []
     ruby_outputs = details.get("ruby") or []
+    case_notes: List[str] = []
     for idx, case in enumerate(cases):
         expected = python_outputs[idx] if idx < len(python_outputs) else None
         actual = ruby_outputs[idx] if idx < len(ruby_outputs) else None
         if expected:
-            requirements.setdefault("cases", []).append(
+            case_notes.append(
                 f"Input {case} → scaled={expected.get('scaled')} "
                 f"report={expected.get('report')}"
             )
         if actual and expected and actual != expected:
-            requirements.setdefault("cases", []).append(
+            case_notes.append(
                 f"Mismatch observed: Ruby returned {actual} for {case}"
             )
-    ruby_tests = details.get("ruby_tests") or []
-    for test in ruby_tests:
+    if case_notes:
+        requirements["cases"] = case_notes
+    test_notes: List[str] = []
+    for test in details.get("ruby_tests") or []:
         name = test.get("name")
         status = test.get("status")
         message = test.get("message")
-        requirements.setdefault("ruby_tests", []).append(
-            f"{name}: {status} ({message})"
-        )
-    return requirements
+        if status != "passed":
+            hints.append(f"Fix {name}: {message}")
+        test_notes.append(f"{name}: {status} ({message})")
+    if test_notes:
+        requirements["ruby_tests"] = test_notes
+    return hints, requirements
@@ -19,4 +19,4 @@ def scale_scores(values: Iterable[int]) -> List[int]:
 
 def render_report(values: Iterable[int]) -> str:
     doubled = scale_scores(values)
-    return ", ".join(str(item) for item in doubled)
+    return ", ".join(map(str, doubled))
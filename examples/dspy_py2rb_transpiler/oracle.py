@@ -2,19 +2,69 @@
 
 from __future__ import annotations
 
+import atexit
+import copy
+import hashlib
 import json
 import os
+import selectors
 import shutil
 import subprocess
 import tempfile
 import textwrap
+import threading
 
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
+from itertools import zip_longest
 from pathlib import Path
-from typing import Any, Dict, Iterable, List
+from types import CodeType
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 from langformer.types import Oracle, VerifyResult
 from langformer.verification.oracles import OracleRegistry
 
+try:  # pragma: no cover - optional dependency
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+# Candidate files are short-lived; keep them on tmpfs when it is available.
+_SHM_DIR = Path("/dev/shm")
+_TEMP_PARENT: Optional[str] = str(_SHM_DIR) if _SHM_DIR.is_dir() else None
+
+# Keeping inherited fds open (our pipes are non-inheritable anyway) and
+# passing an absolute executable lets CPython spawn via posix_spawn instead
+# of fork+exec, which avoids copying a large orchestrator's page tables.
+_SPAWN_KWARGS: Dict[str, Any] = {
+    "close_fds": False,
+    "start_new_session": False,
+}
+
+
+def _dumps(payload: Any) -> str:
+    if orjson is not None:
+        return orjson.dumps(payload).decode("utf-8")
+    return json.dumps(payload, separators=(",", ":"))
+
+
+_loads = orjson.loads if orjson is not None else json.loads
+
+# Passes and pure output mismatches are deterministic for a given oracle
+# config, Ruby test contents, Python source and Ruby candidate, and retries
+# often resubmit identical pairs, so keep the most recent such results
+# keyed by content digests. Anything else (crashes, test failures) is re-run
+# next time.
+_VERIFIED_CACHE: OrderedDict[
+    Tuple[bytes, bytes, bytes, bytes], VerifyResult
+] = OrderedDict()
+_VERIFIED_CACHE_SIZE = 512
+_VERIFIED_LOCK = threading.Lock()
+
+_MISMATCH_FAILURE = "Ruby outputs did not match Python results."
+
 
 def register_oracle() -> None:
     """Expose the oracle under the ``dspy_py2rb`` identifier."""
@@ -31,53 +81,128 @@ def _build_oracle(config: Dict[str, Any]) -> Oracle:
     ruby_tests: List[Path] = [
         Path(test_path) for test_path in config.get("ruby_tests", [])
     ]
+    fail_fast = bool(config.get("fail_fast", True))
+    config_digest = _digest(
+        _dumps([cases, [str(path) for path in ruby_tests], fail_fast])
+    )
+    oracle = _Py2RbOracle(
+        cases=tuple(cases),
+        ruby_tests=tuple(ruby_tests),
+        fail_fast=fail_fast,
+        config_digest=config_digest,
+    )
+    return Oracle(verify=oracle.verify)
+
+
+@dataclass(frozen=True, slots=True)
+class _Py2RbOracle:
+    cases: Tuple[Dict[str, Any], ...]
+    ruby_tests: Tuple[Path, ...]
+    fail_fast: bool
+    config_digest: bytes
 
     def verify(
+        self,
         source_code: str,
         target_code: str,
         metadata: Dict[str, Any],
     ) -> VerifyResult:
-        try:
-            temp_dir = Path(tempfile.mkdtemp(prefix="dspy_py2rb_oracle"))
+        # Test files are re-hashed on every call so edits made while the
+        # oracle is alive invalidate earlier verdicts.
+        tests_digest = b"".join(_file_digest(path) for path in self.ruby_tests)
+        key = (
+            self.config_digest,
+            tests_digest,
+            _digest(source_code),
+            _digest(target_code),
+        )
+        with _VERIFIED_LOCK:
+            cached = _VERIFIED_CACHE.get(key)
+            if cached is not None:
+                _VERIFIED_CACHE.move_to_end(key)
+        if cached is None:
+            cached = self._run(source_code, target_code)
+            if _is_deterministic(cached):
+                with _VERIFIED_LOCK:
+                    _VERIFIED_CACHE[key] = cached
+                    if len(_VERIFIED_CACHE) > _VERIFIED_CACHE_SIZE:
+                        _VERIFIED_CACHE.popitem(last=False)
+        # Callers may mutate nested lists; never hand out the cached ones.
+        details = copy.deepcopy(cached.details)
+        details["unit"] = metadata.get("unit")
+        return VerifyResult(passed=cached.passed, details=details)
+
+    def _run(self, source_code: str, target_code: str) -> VerifyResult:
+        with tempfile.TemporaryDirectory(
+            prefix="dspy_py2rb_oracle", dir=_TEMP_PARENT
+        ) as temp_root:
+            temp_dir = Path(temp_root)
             candidate_path = temp_dir / "candidate.rb"
             candidate_path.write_text(target_code, encoding="utf-8")
             failures: List[str] = []
             details: Dict[str, Any] = {
                 "strategy": "dspy_py2rb",
-                "unit": metadata.get("unit"),
-                "cases": cases,
+                "unit": None,
+                "cases": list(self.cases),
             }
-            try:
-                _check_ruby_syntax(candidate_path)
-                details["syntax"] = {"passed": True}
-            except Exception as exc:
-                failures.append(f"Ruby syntax error: {exc}")
-                details["syntax"] = {"passed": False, "error": str(exc)}
-            try:
-                python_outputs = _run_python_cases(source_code, cases)
+            # Ruby cases and Ruby tests are independent subprocess waits, so
+            # both run in the background while the Python reference
+            # executes in this thread; the critical path is the slowest one.
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                ruby_future = executor.submit(
+                    _run_ruby_cases, candidate_path, self.cases
+                )
+                tests_future = (
+                    executor.submit(
+                        _run_ruby_tests,
+                        candidate_path,
+                        self.ruby_tests,
+                        fail_fast=self.fail_fast,
+                    )
+                    if self.ruby_tests
+                    else None
+                )
                 try:
-                    ruby_outputs = _run_ruby_cases(
-                        candidate_path, temp_dir, cases
+                    python_outputs = _run_python_cases(
+                        source_code, self.cases
                     )
+                    python_error = None
+                except Exception as exc:  # pragma: no cover - defensive
+                    python_outputs = []
+                    python_error = exc
+                try:
+                    ruby_outputs = ruby_future.result()
+                    ruby_error = None
                 except Exception as exc:  # pragma: no cover - defensive
-                    failures.append(f"Ruby execution failed: {exc}")
-                    details["ruby_error"] = str(exc)
                     ruby_outputs = []
+                    ruby_error = exc
+                test_results = (
+                    tests_future.result() if tests_future is not None else []
+                )
+            # The server loads the candidate before running cases, so a
+            # parse failure doubles as the syntax check.
+            if isinstance(ruby_error, _RubySyntaxError):
+                failures.append(f"Ruby syntax error: {ruby_error}")
+                details["syntax"] = {"passed": False, "error": str(ruby_error)}
+                ruby_error = None
+            else:
+                details["syntax"] = {"passed": True}
+            if python_error is not None:
+                failures.append(f"Python execution failed: {python_error}")
+                details["python_error"] = str(python_error)
+            else:
+                if ruby_error is not None:
+                    failures.append(f"Ruby execution failed: {ruby_error}")
+                    details["ruby_error"] = str(ruby_error)
                 mismatch = _capture_mismatch(
-                    cases, python_outputs, ruby_outputs
+                    self.cases, python_outputs, ruby_outputs
                 )
                 details["python"] = python_outputs
                 details["ruby"] = ruby_outputs
                 if mismatch:
-                    failures.append(
-                        "Ruby outputs did not match Python results."
-                    )
+                    failures.append(_MISMATCH_FAILURE)
                     details["mismatch"] = mismatch
-            except Exception as exc:  # pragma: no cover - defensive
-                failures.append(f"Python execution failed: {exc}")
-                details["python_error"] = str(exc)
-            if ruby_tests:
-                test_results = _run_ruby_tests(candidate_path, ruby_tests)
+            if self.ruby_tests:
                 details["ruby_tests"] = test_results
                 failed_tests = [
                     test
@@ -93,15 +218,36 @@ def _build_oracle(config: Dict[str, Any]) -> Oracle:
             if failures:
                 details["failures"] = failures
             return VerifyResult(passed=passed, details=details)
-        finally:
-            shutil.rmtree(temp_dir, ignore_errors=True)
 
-    return Oracle(verify=verify)
+
+def _digest(text: str) -> bytes:
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+
+
+def _file_digest(path: Path) -> bytes:
+    try:
+        data = path.read_bytes()
+    except OSError:
+        # A missing test fails verification, and failures are not cached.
+        data = b""
+    return hashlib.blake2b(data, digest_size=16).digest()
+
+
+def _is_deterministic(result: VerifyResult) -> bool:
+    if result.passed:
+        return True
+    return result.details.get("failures") == [_MISMATCH_FAILURE]
+
+
+@lru_cache(maxsize=128)
+def _compile_source(source_code: str) -> CodeType:
+    return compile(source_code, "<dspy_py2rb_oracle>", "exec")
 
 
 def _run_python_cases(source_code: str, cases: Iterable[Dict[str, Any]]):
     ns: Dict[str, Any] = {}
-    exec(source_code, ns, ns)
+    # The Python source is fixed across retries; only compile it once.
+    exec(_compile_source(source_code), ns, ns)
     scale_scores = ns.get("scale_scores")
     render_report = ns.get("render_report")
     if not callable(scale_scores) or not callable(render_report):
@@ -115,71 +261,209 @@ def _run_python_cases(source_code: str, cases: Iterable[Dict[str, Any]]):
     return outputs
 
 
-def _check_ruby_syntax(candidate_path: Path) -> None:
-    proc = subprocess.run(
-        ["ruby", "-c", str(candidate_path)],
-        capture_output=True,
-        text=True,
-    )
-    if proc.returncode != 0:
-        raise RuntimeError(
-            proc.stderr.strip()
-            or proc.stdout.strip()
-            or "Ruby syntax check failed."
+def _run_ruby_cases(candidate_path: Path, cases: Iterable[Dict[str, Any]]):
+    return _get_ruby_server().run(candidate_path, list(cases))
+
+
+class _RubySyntaxError(RuntimeError):
+    pass
+
+
+class _RubyServer:
+    """Long-lived ``ruby`` process that evaluates candidates over stdio.
+
+    Each request is one JSON line (candidate path + cases) and each reply
+    is one JSON line, so verify() calls skip interpreter startup. Every
+    candidate is evaluated in a forked child, so nothing it defines leaks
+    into the next request. The process is respawned if it dies.
+    """
+
+    def __init__(self) -> None:
+        self._proc: Optional[subprocess.Popen[str]] = None
+        self._lock = threading.Lock()
+
+    def run(
+        self, candidate_path: Path, cases: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        request = _dumps(
+            {"candidate": str(candidate_path.resolve()), "cases": cases}
         )
+        with self._lock:
+            line = self._roundtrip(request)
+            if not line:
+                # The previous process died; retry once on a fresh
+                # interpreter.
+                self._stop()
+                line = self._roundtrip(request)
+        if not line:
+            raise RuntimeError("Ruby server exited without a response")
+        response = _loads(line)
+        if "error" in response:
+            if response.get("type") == "syntax":
+                raise _RubySyntaxError(response["error"])
+            raise RuntimeError(response["error"])
+        return response["results"]
 
+    def close(self) -> None:
+        with self._lock:
+            self._stop()
 
-def _run_ruby_cases(
-    candidate_path: Path, temp_dir: Path, cases: Iterable[Dict[str, Any]]
-):
-    harness_path = temp_dir / "runner.rb"
-    harness_path.write_text(_RUBY_HARNESS, encoding="utf-8")
-    outputs = []
-    for case in cases:
-        payload = json.dumps(case)
-        proc = subprocess.run(
-            ["ruby", str(harness_path), payload],
-            capture_output=True,
+    def _roundtrip(self, request: str) -> str:
+        proc = self._ensure_started()
+        assert proc.stdin is not None and proc.stdout is not None
+        try:
+            proc.stdin.write(request + "\n")
+            proc.stdin.flush()
+            return proc.stdout.readline()
+        except (BrokenPipeError, OSError):
+            return ""
+
+    def _ensure_started(self) -> subprocess.Popen[str]:
+        if self._proc is not None and self._proc.poll() is None:
+            return self._proc
+        self._proc = subprocess.Popen(
+            [_ruby_executable(), str(_harness_path())],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
             text=True,
-            check=True,
+            bufsize=1,
+            **_SPAWN_KWARGS,
         )
-        if not proc.stdout.strip():
-            raise RuntimeError(proc.stderr.strip() or "Ruby produced no output")
-        outputs.append(json.loads(proc.stdout.strip()))
-    return outputs
+        return self._proc
+
+    def _stop(self) -> None:
+        proc, self._proc = self._proc, None
+        if proc is not None:
+            try:
+                if proc.stdin is not None:
+                    proc.stdin.close()
+                proc.wait(timeout=5)
+            except (OSError, subprocess.TimeoutExpired):
+                proc.kill()
+                proc.wait()
+            if proc.stdout is not None:
+                proc.stdout.close()
+
+
+@lru_cache(maxsize=1)
+def _ruby_executable() -> str:
+    return shutil.which("ruby") or "ruby"
+
+
+_HARNESS_DIR: Optional[str] = None
+
+
+@lru_cache(maxsize=1)
+def _harness_path() -> Path:
+    # The harness never changes, so write it once per process. It goes in
+    # a private mkdtemp() directory: a predictable name in the shared temp
+    # dir could be pre-planted by another user and then executed.
+    global _HARNESS_DIR
+    _HARNESS_DIR = tempfile.mkdtemp(prefix="dspy_py2rb_harness")
+    path = Path(_HARNESS_DIR) / "harness.rb"
+    path.write_text(_RUBY_HARNESS, encoding="utf-8")
+    return path
+
+
+_RUBY_SERVER: Optional[_RubyServer] = None
+_RUBY_SERVER_LOCK = threading.Lock()
+
+
+def _get_ruby_server() -> _RubyServer:
+    global _RUBY_SERVER
+    with _RUBY_SERVER_LOCK:
+        if _RUBY_SERVER is None:
+            _RUBY_SERVER = _RubyServer()
+            atexit.register(_shutdown_ruby_server)
+        return _RUBY_SERVER
 
 
-def _run_ruby_tests(candidate_path: Path, tests: Iterable[Path]):
-    if not tests:
+def _shutdown_ruby_server() -> None:
+    global _HARNESS_DIR
+    if _RUBY_SERVER is not None:
+        _RUBY_SERVER.close()
+    if _HARNESS_DIR is not None:
+        shutil.rmtree(_HARNESS_DIR, ignore_errors=True)
+        _HARNESS_DIR = None
+        _harness_path.cache_clear()
+
+
+def _run_ruby_tests(
+    candidate_path: Path, tests: Iterable[Path], fail_fast: bool = True
+):
+    test_paths = list(tests)
+    if not test_paths:
         return []
-    env = os.environ.copy()
+    env = dict(_base_env())
     env["CANDIDATE_PATH"] = str(candidate_path.resolve())
-    results = []
-    for test_path in tests:
-        proc = subprocess.run(
-            ["ruby", str(test_path)],
-            capture_output=True,
-            text=True,
+    # Start every test up front and drain all pipes from this thread with a
+    # selector rather than parking one thread per process. With fail_fast a
+    # single failure already rejects the candidate, so the remaining
+    # processes are killed and left out of the results.
+    procs = [
+        subprocess.Popen(
+            [_ruby_executable(), str(test_path)],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
             env=env,
+            **_SPAWN_KWARGS,
         )
-        if proc.returncode != 0:
-            output = proc.stderr.strip() or proc.stdout.strip() or "unknown error"
-            results.append(
-                {
-                    "name": test_path.name,
-                    "status": "failed",
-                    "message": output,
-                }
-            )
-        else:
-            results.append(
-                {
-                    "name": test_path.name,
-                    "status": "passed",
-                    "message": proc.stdout.strip(),
-                }
-            )
-    return results
+        for test_path in test_paths
+    ]
+    outputs = [(bytearray(), bytearray()) for _ in procs]
+    open_streams = [2] * len(procs)
+    results: List[Optional[Dict[str, Any]]] = [None] * len(procs)
+    aborted = False
+    with selectors.DefaultSelector() as selector:
+        for idx, proc in enumerate(procs):
+            selector.register(proc.stdout, selectors.EVENT_READ, (idx, 0))
+            selector.register(proc.stderr, selectors.EVENT_READ, (idx, 1))
+        while selector.get_map():
+            for key, _ in selector.select():
+                idx, stream = key.data
+                chunk = os.read(key.fd, 65536)
+                if chunk:
+                    outputs[idx][stream].extend(chunk)
+                    continue
+                selector.unregister(key.fileobj)
+                key.fileobj.close()
+                open_streams[idx] -= 1
+                if open_streams[idx] or aborted:
+                    continue
+                result = _ruby_test_result(
+                    test_paths[idx], procs[idx].wait(), *outputs[idx]
+                )
+                results[idx] = result
+                if fail_fast and result["status"] != "passed":
+                    aborted = True
+                    for proc in procs:
+                        if proc.poll() is None:
+                            proc.kill()
+    for proc in procs:
+        proc.wait()
+    # Keep the configured order; tests killed by fail_fast are omitted.
+    return [result for result in results if result is not None]
+
+
+@lru_cache(maxsize=1)
+def _base_env() -> Dict[str, str]:
+    # Snapshot the environment once; each run only adds CANDIDATE_PATH.
+    return os.environ.copy()
+
+
+def _ruby_test_result(
+    test_path: Path, returncode: int, stdout: bytes, stderr: bytes
+) -> Dict[str, Any]:
+    out = stdout.decode("utf-8", "replace").strip()
+    if returncode != 0:
+        err = stderr.decode("utf-8", "replace").strip()
+        return {
+            "name": test_path.name,
+            "status": "failed",
+            "message": err or out or "unknown error",
+        }
+    return {"name": test_path.name, "status": "passed", "message": out}
 
 
 def _capture_mismatch(
@@ -187,32 +471,86 @@ def _capture_mismatch(
     python_outputs: Iterable[Dict[str, Any]],
     ruby_outputs: Iterable[Dict[str, Any]],
 ) -> Dict[str, Any] | None:
-    case_list = list(cases)
-    py = list(python_outputs)
-    rb = list(ruby_outputs)
-    for idx, case in enumerate(case_list):
-        expected = py[idx] if idx < len(py) else None
-        actual = rb[idx] if idx < len(rb) else None
-        if expected != actual:
-            return {"case": case, "python": expected, "ruby": actual}
-    return None
+    return next(
+        (
+            {"case": case, "python": expected, "ruby": actual}
+            for case, expected, actual in zip_longest(
+                cases, python_outputs, ruby_outputs
+            )
+            if expected != actual
+        ),
+        None,
+    )
 
 
 _RUBY_HARNESS = textwrap.dedent(
     """
     require "json"
-    require_relative "candidate"
-
-    payload = JSON.parse(ARGV[0])
-    values = payload["values"]
 
-    unless defined?(Report)
-      raise "Report module not defined"
+    # Prefer the Oj C extension when the gem is installed.
+    begin
+      require "oj"
+      encode = ->(obj) { Oj.dump(obj, mode: :compat) }
+      decode = ->(line) { Oj.load(line, mode: :compat) }
+    rescue LoadError
+      encode = ->(obj) { JSON.generate(obj) }
+      decode = ->(line) { JSON.parse(line) }
     end
 
-    scaled = Report.scale_scores(values)
-    report = Report.render_report(values)
+    # Replies go to the original stdout; anything the candidate prints is
+    # redirected to stderr so it cannot corrupt the line protocol.
+    reply = STDOUT.dup
+    reply.sync = true
+    STDOUT.reopen(STDERR)
 
-    puts JSON.generate({scaled: scaled, report: report})
+    evaluate = lambda do |request|
+      begin
+        load request["candidate"]
+      rescue SyntaxError => e
+        return {error: e.message, type: "syntax"}
+      end
+
+      unless defined?(Report)
+        raise "Report module not defined"
+      end
+
+      results = request["cases"].map do |payload|
+        values = payload["values"]
+        {
+          scaled: Report.scale_scores(values),
+          report: Report.render_report(values)
+        }
+      end
+      {results: results}
+    rescue Exception => e
+      {error: "#{e.class}: #{e.message}"}
+    end
+
+    # Each candidate runs in a forked child so monkeypatches, constants and
+    # globals it defines die with it; the parent only relays the reply.
+    while (line = STDIN.gets)
+      begin
+        request = decode.call(line)
+        reader, writer = IO.pipe
+        pid = fork do
+          reader.close
+          writer.write(encode.call(evaluate.call(request)))
+          writer.close
+          exit!(0)
+        end
+        writer.close
+        payload = reader.read
+        reader.close
+        Process.wait(pid)
+        if payload.empty?
+          payload = encode.call(
+            {error: "Candidate process exited without a response"}
+          )
+        end
+        reply.puts payload
+      rescue Exception => e
+        reply.puts encode.call({error: "#{e.class}: #{e.message}"})
+      end
+    end
     """
 ).strip()
@@ -3,21 +3,30 @@
 from __future__ import annotations
 
 import argparse
+import copy
 import logging
 import sys
 
 from pathlib import Path
+from typing import Any, Dict, Tuple
 
 import yaml
 
 from dotenv import load_dotenv
 
+try:  # pragma: no cover - depends on how PyYAML was built
+    from yaml import CSafeLoader as _Loader
+except ImportError:  # pragma: no cover - pure-Python fallback
+    from yaml import SafeLoader as _Loader  # type: ignore[assignment]
+
 DEFAULT_CONFIG = Path("configs/dspy_py2rb.yaml")
 DEFAULT_SOURCE = Path(
     "examples/dspy_py2rb_transpiler/inputs/report_module.py"
 )
 DEFAULT_OUTPUT_DIR = Path("examples/dspy_py2rb_transpiler/outputs")
 
+_CONFIG_CACHE: Dict[Tuple[str, int], Dict[str, Any]] = {}
+
 
 def _ensure_project_root() -> None:
     root = Path(__file__).resolve().parents[2]
@@ -66,7 +75,7 @@ def main() -> None:
         )
     register_oracle()
 
-    config_data = yaml.safe_load(args.config.read_text())
+    config_data = _load_config(args.config)
     orchestrator = TranspilationOrchestrator(
         config_path=args.config,
         config=config_data,
@@ -80,6 +89,17 @@ def main() -> None:
     )
 
 
+def _load_config(path: Path) -> Dict[str, Any]:
+    resolved = path.resolve()
+    key = (str(resolved), resolved.stat().st_mtime_ns)
+    cached = _CONFIG_CACHE.get(key)
+    if cached is None:
+        cached = yaml.load(resolved.read_text(), Loader=_Loader) or {}
+        _CONFIG_CACHE[key] = cached
+    # The orchestrator keeps a reference to its config, so hand out copies.
+    return copy.deepcopy(cached)
+
+
 def _resolve_target_path(source: Path, explicit_target: Path | None) -> Path:
     if explicit_target is not None:
         return Path(explicit_target)
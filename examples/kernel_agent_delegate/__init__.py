@@ -2,23 +2,110 @@
 
 from __future__ import annotations
 
-from langformer.preprocessing.delegates import DelegateRegistry
-from langformer.preprocessing.planners import PlannerRegistry
+from importlib import import_module
+from pathlib import Path
+from typing import Any, Dict
+
+from langformer.preprocessing.delegates import (
+    DelegateRegistry,
+    ExecutionDelegate,
+)
+from langformer.preprocessing.planners import (
+    ExecutionPlan,
+    ExecutionPlanner,
+    PlannerRegistry,
+)
+from langformer.types import (
+    CandidatePatchSet,
+    IntegrationContext,
+    TranspileUnit,
+    VerifyResult,
+)
 from langformer.verification.oracles import OracleRegistry
 
-from .delegate import KernelAgentDelegate
-from .oracle import build_kernel_agent_oracle
-from .planner import KernelAgentAutoPlanner
+# Each component drags in triton_kernel_agent / Fuser.pipeline /
+# multiprocessing, so the modules are only imported on first use.
+_LAZY_EXPORTS = {
+    "KernelAgentAutoPlanner": ".planner",
+    "KernelAgentDelegate": ".delegate",
+    "build_kernel_agent_oracle": ".oracle",
+}
 
-PlannerRegistry.get_registry().register(
-    "kernel_agent_auto", KernelAgentAutoPlanner
-)
+
+def _load(name: str) -> Any:
+    value = getattr(import_module(_LAZY_EXPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _LAZY_EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return _load(name)
+
+
+class _LazyAutoPlanner(ExecutionPlanner):
+    """Registry entry that builds a KernelAgentAutoPlanner on first use."""
+
+    def __init__(self, config: Dict[str, Any]) -> None:
+        super().__init__(config)
+        self._impl = _load("KernelAgentAutoPlanner")(config=config)
+
+    def plan(self, source_path: Path, config: Dict[str, Any]) -> ExecutionPlan:
+        return self._impl.plan(source_path, config)
+
+    def __getattr__(self, name: str) -> Any:
+        # plan_many(), compact() and friends live on the real planner.
+        if name == "_impl":
+            raise AttributeError(name)
+        return getattr(self._impl, name)
+
+
+class _LazyDelegate(ExecutionDelegate):
+    """Registry entry that builds a KernelAgentDelegate on first use."""
+
+    def __init__(self, config: Dict[str, Any]) -> None:
+        super().__init__(config)
+        self._impl = _load("KernelAgentDelegate")(config=config)
+
+    def execute(
+        self,
+        source_path: Path,
+        target_path: Path,
+        run_root: Path,
+        plan: ExecutionPlan,
+        config: Dict[str, Any],
+    ) -> int:
+        return self._impl.execute(
+            source_path, target_path, run_root, plan, config
+        )
+
+    def verify(
+        self,
+        unit: TranspileUnit,
+        candidate: CandidatePatchSet,
+        ctx: IntegrationContext,
+    ) -> VerifyResult:
+        return self._impl.verify(unit, candidate, ctx)
+
+    def __getattr__(self, name: str) -> Any:
+        if name == "_impl":
+            raise AttributeError(name)
+        return getattr(self._impl, name)
+
+
+def _oracle(config: Dict[str, Any]) -> Any:
+    return _load("build_kernel_agent_oracle")(config)
+
+
+# The registries store classes, so register thin ExecutionPlanner /
+# ExecutionDelegate subclasses that import the real component only when a
+# run instantiates them.
+PlannerRegistry.get_registry().register("kernel_agent_auto", _LazyAutoPlanner)
 DelegateRegistry.get_registry().register(
-    "kernel_agent_delegate", KernelAgentDelegate
-)
-OracleRegistry.get_registry().register(
-    "kernel_agent_runner", build_kernel_agent_oracle
+    "kernel_agent_delegate", _LazyDelegate
 )
+OracleRegistry.get_registry().register("kernel_agent_runner", _oracle)
 
 __all__ = [
     "KernelAgentAutoPlanner",
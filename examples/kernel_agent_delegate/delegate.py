@@ -5,7 +5,7 @@ from __future__ import annotations
 import traceback
 
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Callable, Dict, Tuple
 
 from langformer.preprocessing.delegates import ExecutionDelegate, ExecutionPlan
 from langformer.runtime import RunSession
@@ -58,6 +58,8 @@ class KernelAgentDelegate(ExecutionDelegate):
         self.mode = example_cfg.get("mode", "pipeline")
         self.pipeline_cfg = example_cfg.get("pipeline", {})
         self.kernel_cfg = example_cfg.get("kernel_agent", {})
+        # Units sharing a router config resolve to the same merged settings.
+        self._cfg_cache: Dict[Tuple[Any, ...], Dict[str, Any]] = {}
 
     def execute(
         self,
@@ -153,11 +155,9 @@ class KernelAgentDelegate(ExecutionDelegate):
     def _run_stub(
         self, source_path: Path, target_path: Path
     ) -> Dict[str, Any]:
-        contents = source_path.read_text(encoding="utf-8")
+        contents = source_path.read_bytes()
         target_path.parent.mkdir(parents=True, exist_ok=True)
-        target_path.write_text(
-            f"# delegated stub\n{contents}", encoding="utf-8"
-        )
+        target_path.write_bytes(b"# delegated stub\n" + contents)
         return {
             "mode": "stub",
             "target": str(target_path),
@@ -214,6 +214,7 @@ class KernelAgentDelegate(ExecutionDelegate):
             raise RuntimeError(
                 "TritonKernelAgent is unavailable in this environment"
             )
+        source_text = source_path.read_text(encoding="utf-8")
         log_dir = session.dirs.workers / f"{unit_id}_kernel_agent"
         log_dir.mkdir(parents=True, exist_ok=True)
         agent = TritonKernelAgent(
@@ -225,7 +226,7 @@ class KernelAgentDelegate(ExecutionDelegate):
         )
         try:
             result = agent.generate_kernel(
-                problem_description=source_path.read_text(encoding="utf-8"),
+                problem_description=source_text,
                 test_code=None,
             )
         finally:
@@ -237,9 +238,7 @@ class KernelAgentDelegate(ExecutionDelegate):
             raise RuntimeError(
                 result.get("message", "KernelAgent failed to produce a kernel")
             )
-        kernel_code = result.get("kernel_code") or ""
-        if not kernel_code:
-            kernel_code = source_path.read_text(encoding="utf-8")
+        kernel_code = result.get("kernel_code") or source_text
         target_path.parent.mkdir(parents=True, exist_ok=True)
         target_path.write_text(kernel_code, encoding="utf-8")
         return {
@@ -284,9 +283,7 @@ class KernelAgentDelegate(ExecutionDelegate):
             composed = Path(composed_path)
             if composed.is_file():
                 target_path.parent.mkdir(parents=True, exist_ok=True)
-                target_path.write_text(
-                    composed.read_text(encoding="utf-8"), encoding="utf-8"
-                )
+                target_path.write_bytes(composed.read_bytes())
 
         result = {
             "mode": "pipeline",
@@ -297,9 +294,28 @@ class KernelAgentDelegate(ExecutionDelegate):
         session.write_metadata("kernel_agent_pipeline", result)
         return result
 
+    def _cached_config(
+        self,
+        kind: str,
+        router_cfg: Any,
+        build: Callable[[Any], Dict[str, Any]],
+    ) -> Dict[str, Any]:
+        key = _router_cache_key(kind, router_cfg)
+        try:
+            cfg = self._cfg_cache.get(key)
+        except TypeError:  # unhashable router values; skip the memo
+            return build(router_cfg)
+        if cfg is None:
+            cfg = self._cfg_cache[key] = build(router_cfg)
+        return dict(cfg)
+
     def _build_kernel_config(self, context: Dict[str, Any]) -> Dict[str, Any]:
+        return self._cached_config(
+            "kernel", context.get("router_config"), self._merge_kernel_config
+        )
+
+    def _merge_kernel_config(self, router_cfg: Any) -> Dict[str, Any]:
         cfg: Dict[str, Any] = {**self._DEFAULT_KERNEL_CFG, **self.kernel_cfg}
-        router_cfg = context.get("router_config")
         if isinstance(router_cfg, dict):
             if "ka_max_rounds" in router_cfg:
                 cfg["max_rounds"] = int(router_cfg["ka_max_rounds"])
@@ -318,11 +334,17 @@ class KernelAgentDelegate(ExecutionDelegate):
     def _build_pipeline_config(
         self, context: Dict[str, Any]
     ) -> Dict[str, Any]:
+        return self._cached_config(
+            "pipeline",
+            context.get("router_config"),
+            self._merge_pipeline_config,
+        )
+
+    def _merge_pipeline_config(self, router_cfg: Any) -> Dict[str, Any]:
         cfg: Dict[str, Any] = {
             **self._DEFAULT_PIPELINE_CFG,
             **self.pipeline_cfg,
         }
-        router_cfg = context.get("router_config")
         if isinstance(router_cfg, dict):
             if "fuser_dispatch_jobs" in router_cfg:
                 cfg["dispatch_jobs"] = router_cfg["fuser_dispatch_jobs"]
@@ -364,6 +386,36 @@ class KernelAgentDelegate(ExecutionDelegate):
         return result
 
 
+_MISSING = object()
+_ROUTER_KEYS = (
+    "ka_max_rounds",
+    "ka_num_workers",
+    "ka_model",
+    "fuser_dispatch_jobs",
+    "compose_max_iters",
+    "fuser_verify",
+)
+_LLM_KEYS = ("ka_model", "extract", "dispatch", "compose")
+
+
+def _router_cache_key(kind: str, router_cfg: Any) -> Tuple[Any, ...]:
+    # Only the keys read by the merge helpers matter, so the key tracks
+    # their current values rather than the identity of the router dict.
+    if not isinstance(router_cfg, dict):
+        return (kind,)
+    llm_cfg = router_cfg.get("llm_models")
+    llm_values = (
+        tuple(llm_cfg.get(key) for key in _LLM_KEYS)
+        if isinstance(llm_cfg, dict)
+        else None
+    )
+    return (
+        kind,
+        tuple(router_cfg.get(key, _MISSING) for key in _ROUTER_KEYS),
+        llm_values,
+    )
+
+
 def _first_candidate(candidate: CandidatePatchSet) -> str:
     for _, contents in candidate.files.items():
         return contents
@@ -8,18 +8,62 @@ from __future__ import annotations
 
 import hashlib
 import json
+import os
+import threading
 
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, Optional, Tuple
-
-from Fuser.auto_agent import (  # type: ignore
-    AutoKernelRouter,
-    Complexity,
-    analyze_problem_code,
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
 )
 
 from langformer.preprocessing.planners import ExecutionPlan, ExecutionPlanner
 
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    from Fuser.auto_agent import AutoKernelRouter, Complexity  # type: ignore
+
+try:  # pragma: no cover - optional dependency
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+
+def _json_dumps(payload: Any) -> str:
+    if orjson is not None:
+        try:
+            return orjson.dumps(payload).decode("utf-8")
+        except TypeError:
+            # orjson rejects some inputs stdlib json accepts (e.g. int keys).
+            pass
+    return json.dumps(payload, separators=(",", ":"))
+
+
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+
+def _auto_agent() -> Any:
+    # Fuser is heavy; only pay for it once a plan actually needs analysis.
+    import Fuser.auto_agent as auto_agent  # type: ignore
+
+    return auto_agent
+
+
+@lru_cache(maxsize=4)
+def _build_router(
+    router_args: Tuple[Tuple[str, Any], ...],
+) -> AutoKernelRouter:
+    # Planners with identical router settings share one router (and the
+    # LLM client behind it) instead of constructing their own. Failures
+    # propagate so lru_cache never memoizes them; the next plan retries.
+    return _auto_agent().AutoKernelRouter(**dict(router_args))
+
 
 def _complexity_to_dict(cx: Complexity) -> Dict[str, Any]:
     return {
@@ -35,6 +79,66 @@ def _complexity_to_dict(cx: Complexity) -> Dict[str, Any]:
     }
 
 
+_COMPACT_MIN_LINES = 1024
+
+# Parsed caches shared by planners pointing at the same file, keyed by
+# absolute path: ``(mtime_ns, cache, line_count, needs_rewrite)``. A new
+# planner on an unchanged file skips the JSONL decode entirely.
+_SHARED_CACHES: Dict[str, Tuple[int, Dict[str, Any], int, bool]] = {}
+_SHARED_CACHES_LOCK = threading.Lock()
+
+_STRATEGY_TO_ROUTE = {
+    "kernelagent": "kernel_agent",
+    "kernel_then_fuser": "kernel_agent",
+    "fuser": "fuser",
+    "fuser_then_kernel": "fuser",
+}
+_VALID_STRATEGIES = frozenset(_STRATEGY_TO_ROUTE)
+
+
+def _read_source(path: Path) -> Tuple[bytes, str]:
+    # One read serves both the cache key and, on a miss, the analysis, so
+    # each source is scanned from disk exactly once per plan.
+    data = path.read_bytes()
+    return data, hashlib.sha256(data).hexdigest()
+
+
+def _mtime_ns(path: Path) -> int:
+    try:
+        return path.stat().st_mtime_ns
+    except OSError:
+        return -1
+
+
+def _load_cache(path: Path) -> Tuple[Dict[str, Any], int, bool]:
+    """Return ``(cache, line_count, needs_rewrite)`` for ``path``."""
+
+    cache: Dict[str, Any] = {}
+    lines = 0
+    malformed = False
+    try:
+        with path.open("r", encoding="utf-8") as handle:
+            for line in handle:
+                if not line.strip():
+                    continue
+                try:
+                    cache.update(_json_loads(line))
+                    lines += 1
+                except (ValueError, TypeError):
+                    # Torn trailing write or a pre-JSONL cache.
+                    malformed = True
+    except OSError:
+        return {}, 0, False
+    if malformed and not cache:
+        # Older caches were a single indented JSON document.
+        try:
+            legacy = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}, 0, True
+        return (legacy if isinstance(legacy, dict) else {}), 0, True
+    return cache, lines, malformed
+
+
 class KernelAgentAutoPlanner(ExecutionPlanner):
     """Thin wrapper around Fuser's autorouter heuristics and cache."""
 
@@ -47,75 +151,129 @@ class KernelAgentAutoPlanner(ExecutionPlanner):
         self.cache_path = (
             Path(cache_path_arg)
             if cache_path_arg
-            else Path(".fuse") / "router_cache.json"
+            else Path(".fuse") / "router_cache.jsonl"
         )
+        # The default cache used to be a single JSON document; read it
+        # once so existing routing decisions migrate into the JSONL file.
+        self._legacy_cache_path: Optional[Path] = (
+            None if cache_path_arg else Path(".fuse") / "router_cache.json"
+        )
+        self._cache: Optional[Dict[str, Any]] = None
+        self._cache_lines = 0
+        self._cache_needs_rewrite = False
+        self._cache_mtime = -1
         self.router_cfg = cfg.get("router") or {}
         self.router_enabled = bool(self.router_cfg.get("model"))
         self._router: Optional[AutoKernelRouter] = None
 
     def plan(self, source_path: Path, config: Dict[str, Any]) -> ExecutionPlan:
-        try:
-            code = source_path.read_text(encoding="utf-8")
-        except FileNotFoundError:
-            return ExecutionPlan(
-                action="transpile", context={"error": "missing_source"}
-            )
+        return self.plan_many([source_path], config)[0]
+
+    def plan_many(
+        self,
+        source_paths: Sequence[Path],
+        config: Dict[str, Any],
+        max_workers: int = 8,
+    ) -> List[ExecutionPlan]:
+        """Plan several sources, analysing cache misses concurrently.
+
+        Router calls are network-bound, so a batch of misses costs roughly
+        the slowest decision instead of the sum of all of them.
+        """
 
         cache = self._read_cache()
-        digest = hashlib.sha256(code.encode("utf-8")).hexdigest()
-        cached_entry = cache.get(digest)
+        plans: List[Optional[ExecutionPlan]] = [None] * len(source_paths)
+        misses: Dict[str, List[int]] = {}
+        miss_sources: Dict[str, bytes] = {}
+        for idx, source_path in enumerate(source_paths):
+            try:
+                data, digest = _read_source(source_path)
+            except FileNotFoundError:
+                plans[idx] = ExecutionPlan(
+                    action="transpile", context={"error": "missing_source"}
+                )
+                continue
+            cached_entry = cache.get(digest)
+            if cached_entry:
+                plans[idx] = self._plan_from_entry(
+                    source_path, cached_entry, "cache"
+                )
+            else:
+                misses.setdefault(digest, []).append(idx)
+                miss_sources.setdefault(digest, data)
 
-        context: Dict[str, Any] = {
-            "planner": "kernel_agent_auto",
-            "source": str(source_path),
-        }
+        if misses:
+            firsts = [source_paths[idxs[0]] for idxs in misses.values()]
+            datas = list(miss_sources.values())
+            if len(firsts) == 1:
+                decisions = [self._analyze(firsts[0], datas[0])]
+            else:
+                # Build the shared router up front rather than racing on it.
+                self._ensure_router()
+                workers = max(1, min(max_workers, len(firsts)))
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    decisions = list(
+                        executor.map(self._analyze, firsts, datas)
+                    )
+            for (digest, idxs), (entry, route_source) in zip(
+                misses.items(), decisions
+            ):
+                cache[digest] = entry
+                self._write_cache(digest, entry)
+                for idx in idxs:
+                    plans[idx] = self._plan_from_entry(
+                        source_paths[idx], entry, route_source
+                    )
+        return [plan for plan in plans if plan is not None]
 
+    def _analyze(
+        self, source_path: Path, data: bytes
+    ) -> Tuple[Dict[str, Any], str]:
+        # Only a miss needs the source text; hits are pure hash work.
+        code = data.decode("utf-8")
+        complexity = _auto_agent().analyze_problem_code(code)
+        heuristic_prefers_fuser = complexity.route_to_fuser()
+        strategy = None
+        confidence = None
         route_cfg: Dict[str, Any] = {}
-
-        if cached_entry:
-            strategy = cached_entry.get("route_strategy")
-            confidence = cached_entry.get("confidence")
-            complexity_data = cached_entry.get("complexity")
-            route_source = "cache"
-            route = cached_entry.get(
-                "route",
-                self._route_from_strategy(strategy, default="kernel_agent"),
-            )
-            entry_cfg = cached_entry.get("config")
-            if isinstance(entry_cfg, dict):
-                route_cfg = entry_cfg
-        else:
-            complexity = analyze_problem_code(code)
-            heuristic_prefers_fuser = complexity.route_to_fuser()
-            strategy = None
-            confidence = None
-            route_source = "analysis"
-            if self.router_enabled:
-                strategy, confidence, route_cfg = self._decide_with_router(
-                    source_path, code, complexity
-                )
-                if strategy:
-                    route_source = "router"
-            strategy = self._normalize_strategy(
-                strategy, heuristic_prefers_fuser
-            )
-            route = self._route_from_strategy(
-                strategy, heuristic_prefers_fuser
+        route_source = "analysis"
+        if self.router_enabled:
+            strategy, confidence, route_cfg = self._decide_with_router(
+                source_path, code, complexity
             )
+            if strategy:
+                route_source = "router"
+        strategy = self._normalize_strategy(strategy, heuristic_prefers_fuser)
+        route = self._route_from_strategy(strategy, heuristic_prefers_fuser)
+        entry = {
+            "route": route,
+            "unit": source_path.name,
+            "complexity": _complexity_to_dict(complexity),
+            "route_strategy": strategy,
+            "confidence": confidence,
+            "config": route_cfg,
+        }
+        return entry, route_source
 
-            complexity_data = _complexity_to_dict(complexity)
-            cache[digest] = {
-                "route": route,
-                "unit": source_path.name,
-                "complexity": complexity_data,
-                "route_strategy": strategy,
-                "confidence": confidence,
-                "config": route_cfg,
-            }
-            self._write_cache(cache)
-
-        context["route"] = route
-        context["route_source"] = route_source
+    def _plan_from_entry(
+        self, source_path: Path, entry: Dict[str, Any], route_source: str
+    ) -> ExecutionPlan:
+        strategy = entry.get("route_strategy")
+        confidence = entry.get("confidence")
+        complexity_data = entry.get("complexity")
+        route = entry.get(
+            "route",
+            self._route_from_strategy(strategy, default="kernel_agent"),
+        )
+        entry_cfg = entry.get("config")
+        route_cfg = entry_cfg if isinstance(entry_cfg, dict) else {}
+
+        context: Dict[str, Any] = {
+            "planner": "kernel_agent_auto",
+            "source": str(source_path),
+            "route": route,
+            "route_source": route_source,
+        }
         if strategy:
             context["route_strategy"] = strategy
         if complexity_data:
@@ -183,40 +341,111 @@ class KernelAgentAutoPlanner(ExecutionPlanner):
             "dispatch_jobs": 1,
             "allow_fallback": False,
         }
+        router_key: Optional[Tuple[Tuple[str, Any], ...]] = tuple(
+            router_args.items()
+        )
+        try:
+            hash(router_key)
+        except TypeError:  # unhashable router settings; build directly
+            router_key = None
         try:
-            self._router = AutoKernelRouter(**router_args)
+            if router_key is None:
+                self._router = _auto_agent().AutoKernelRouter(**router_args)
+            else:
+                self._router = _build_router(router_key)
         except Exception:
             self._router = None
         return self._router
 
     def _read_cache(self) -> Dict[str, Any]:
-        if not self.cache_path.is_file():
-            return {}
+        # Reuse the parsed cache unless another writer touched the file.
+        mtime = _mtime_ns(self.cache_path)
+        if self._cache is None or mtime != self._cache_mtime:
+            key = os.path.abspath(self.cache_path)
+            with _SHARED_CACHES_LOCK:
+                shared = _SHARED_CACHES.get(key)
+            if shared is None or shared[0] != mtime:
+                shared = (mtime, *self._load_cache_file(mtime))
+                with _SHARED_CACHES_LOCK:
+                    _SHARED_CACHES[key] = shared
+            (
+                self._cache_mtime,
+                self._cache,
+                self._cache_lines,
+                self._cache_needs_rewrite,
+            ) = shared
+        return self._cache
+
+    def _load_cache_file(
+        self, mtime: int
+    ) -> Tuple[Dict[str, Any], int, bool]:
+        if mtime == -1 and self._legacy_cache_path is not None:
+            legacy, _, _ = _load_cache(self._legacy_cache_path)
+            if legacy:
+                # The first write compacts these entries into cache_path.
+                return legacy, 0, True
+        return _load_cache(self.cache_path)
+
+    def _publish_cache(self) -> None:
+        # The dict is shared by reference, so only the file bookkeeping
+        # needs refreshing after this planner writes.
+        if self._cache is None:
+            return
+        with _SHARED_CACHES_LOCK:
+            _SHARED_CACHES[os.path.abspath(self.cache_path)] = (
+                self._cache_mtime,
+                self._cache,
+                self._cache_lines,
+                self._cache_needs_rewrite,
+            )
+
+    def _write_cache(self, digest: str, entry: Dict[str, Any]) -> None:
+        # Append one JSON line per decision instead of rewriting the whole
+        # cache; later lines win when the file is read back.
+        if self._cache_needs_rewrite:
+            # Don't append JSONL to a legacy/corrupt file; rewrite it whole.
+            self.compact()
+            return
+        line = _json_dumps({digest: entry})
         try:
-            return json.loads(self.cache_path.read_text(encoding="utf-8"))
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            with self.cache_path.open("a", encoding="utf-8") as handle:
+                handle.write(line + "\n")
+            self._cache_lines += 1
+            self._cache_mtime = _mtime_ns(self.cache_path)
+            self._publish_cache()
+            cache = self._cache or {}
+            if (
+                self._cache_lines > _COMPACT_MIN_LINES
+                and self._cache_lines > 2 * len(cache)
+            ):
+                self.compact()
         except Exception:
-            return {}
+            pass
 
-    def _write_cache(self, cache: Dict[str, Any]) -> None:
+    def compact(self) -> None:
+        """Rewrite the cache file with a single line per digest."""
+
+        cache = self._read_cache()
+        tmp_path = self.cache_path.with_name(self.cache_path.name + ".tmp")
         try:
             self.cache_path.parent.mkdir(parents=True, exist_ok=True)
-            self.cache_path.write_text(
-                json.dumps(cache, indent=2), encoding="utf-8"
-            )
+            with tmp_path.open("w", encoding="utf-8") as handle:
+                for digest, entry in cache.items():
+                    handle.write(_json_dumps({digest: entry}) + "\n")
+            os.replace(tmp_path, self.cache_path)
+            self._cache_lines = len(cache)
+            self._cache_needs_rewrite = False
+            self._cache_mtime = _mtime_ns(self.cache_path)
+            self._publish_cache()
         except Exception:
             pass
 
     def _normalize_strategy(
         self, strategy: Optional[str], heuristic_prefers_fuser: bool
     ) -> str:
-        valid = {
-            "kernelagent",
-            "fuser",
-            "kernel_then_fuser",
-            "fuser_then_kernel",
-        }
-        if strategy and strategy in valid:
-            return strategy
+        if strategy in _VALID_STRATEGIES:
+            return strategy  # type: ignore[return-value]
         return "fuser" if heuristic_prefers_fuser else "kernelagent"
 
     def _route_from_strategy(
@@ -225,10 +454,9 @@ class KernelAgentAutoPlanner(ExecutionPlanner):
         heuristic_prefers_fuser: Optional[bool] = None,
         default: str = "kernel_agent",
     ) -> str:
-        if strategy in ("kernelagent", "kernel_then_fuser"):
-            return "kernel_agent"
-        if strategy in ("fuser", "fuser_then_kernel"):
-            return "fuser"
+        route = _STRATEGY_TO_ROUTE.get(strategy)  # type: ignore[arg-type]
+        if route is not None:
+            return route
         if heuristic_prefers_fuser is not None:
             return "fuser" if heuristic_prefers_fuser else "kernel_agent"
         return default
@@ -236,14 +464,8 @@ class KernelAgentAutoPlanner(ExecutionPlanner):
     def _solver_from_strategy(
         self, strategy: Optional[str], route: str
     ) -> str:
-        valid = {
-            "kernelagent",
-            "fuser",
-            "kernel_then_fuser",
-            "fuser_then_kernel",
-        }
-        if strategy in valid:
-            return strategy
+        if strategy in _VALID_STRATEGIES:
+            return strategy  # type: ignore[return-value]
         return "fuser" if route == "fuser" else "kernelagent"
 
 
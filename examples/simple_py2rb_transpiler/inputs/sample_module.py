@@ -9,6 +9,8 @@ Expectations for the Ruby translation:
 
 from __future__ import annotations
 
+import json
+
 from typing import Sequence
 
 
@@ -32,12 +34,9 @@ def generate_report(
 ) -> str:
     """Return a textual (or JSON) report of winners over the threshold."""
 
-    winners = sorted(
-        name for name, score in metrics.items() if score >= threshold
-    )
+    winners = [name for name, score in metrics.items() if score >= threshold]
+    winners.sort()
     if fmt == "json":
-        import json
-
         return json.dumps({"winners": winners, "count": len(winners)})
 
     body = ", ".join(winners) if winners else "n/a"
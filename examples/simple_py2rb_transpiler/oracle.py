@@ -2,24 +2,55 @@
 
 from __future__ import annotations
 
+import hashlib
 import json
 import shutil
 import subprocess
 import tempfile
-import textwrap
+import threading
 
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List
+from types import CodeType
+from typing import Any, Dict, List, Optional, Tuple
 
 from langformer.types import Oracle, VerifyResult
 from langformer.verification.oracles import OracleRegistry
 
+try:  # pragma: no cover - optional dependency
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+
+def _json_dumps(payload: Any) -> str:
+    if orjson is not None:
+        try:
+            return orjson.dumps(payload).decode("utf-8")
+        except TypeError:
+            # orjson rejects some inputs stdlib json accepts (e.g. int keys).
+            pass
+    return json.dumps(payload, separators=(",", ":"))
+
+
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+
+_REGISTERED_WITH: Optional[OracleRegistry] = None
+
 
 def register_oracle() -> None:
     """Register the example oracle with the global registry."""
 
+    global _REGISTERED_WITH
     registry = OracleRegistry.get_registry()
+    # Re-imports only need to register once per registry instance.
+    if _REGISTERED_WITH is registry:
+        return
     registry.register("simple_py2rb", _build_oracle)
+    _REGISTERED_WITH = registry
 
 
 def _build_oracle(config: Dict[str, Any]) -> Oracle:
@@ -35,39 +66,55 @@ def _build_oracle(config: Dict[str, Any]) -> Oracle:
             }
         ]
 
+    workspace = _Workspace()
+
     def verify(
         source_code: str, target_code: str, metadata: Dict[str, Any]
     ) -> VerifyResult:
-        python_namespace = _load_python_functions(source_code)
-        py_outputs = [
-            _run_python_case(python_namespace, case) for case in cases
-        ]
-        try:
-            rb_outputs = [_run_ruby_case(target_code, case) for case in cases]
-        except Exception as exc:  # pragma: no cover - defensive path
-            return VerifyResult(
-                passed=False,
-                details={"strategy": "simple_py2rb", "error": str(exc)},
-            )
-
-        passed = py_outputs == rb_outputs
-        return VerifyResult(
-            passed=passed,
-            details={
-                "strategy": "simple_py2rb",
-                "python_outputs": py_outputs,
-                "ruby_outputs": rb_outputs,
-                "cases": cases,
-                "unit": metadata.get("unit"),
-            },
-        )
+        # The Ruby side is subprocess-bound, so start it first and evaluate
+        # the Python reference while the interpreter boots.
+        work_dir = workspace.prepare(target_code)
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            rb_future = executor.submit(_run_ruby_cases, work_dir, cases)
+            python_namespace = _load_python_functions(source_code)
+            py_outputs = [
+                _run_python_case(python_namespace, case) for case in cases
+            ]
+            try:
+                rb_outputs, rb_errors = rb_future.result()
+            except Exception as exc:  # pragma: no cover - defensive path
+                return VerifyResult(
+                    passed=False,
+                    details={"strategy": "simple_py2rb", "error": str(exc)},
+                )
+
+        passed = not rb_errors and py_outputs == rb_outputs
+        details: Dict[str, Any] = {
+            "strategy": "simple_py2rb",
+            "python_outputs": py_outputs,
+            "ruby_outputs": rb_outputs,
+            "cases": cases,
+            "unit": metadata.get("unit"),
+        }
+        if rb_errors:
+            # Cases that did run keep their outputs above; failures are
+            # reported per case.
+            details["error"] = rb_errors[0]["error"]
+            details["ruby_errors"] = rb_errors
+        return VerifyResult(passed=passed, details=details)
 
     return Oracle(verify=verify)
 
 
+@lru_cache(maxsize=32)
+def _compile_source(source_code: str) -> CodeType:
+    return compile(source_code, "<simple_py2rb_oracle>", "exec")
+
+
 def _load_python_functions(source_code: str) -> Dict[str, Any]:
-    namespace: Dict[str, Any] = {}
-    exec(source_code, namespace, namespace)
+    # Retries verify the same source repeatedly; only compile it once.
+    namespace: Dict[str, Any] = {"__name__": "__oracle__"}
+    exec(_compile_source(source_code), namespace)
     required = ["normalize_scores", "generate_report"]
     missing = [name for name in required if name not in namespace]
     if missing:
@@ -85,62 +132,150 @@ def _run_python_case(
     norm = normalize(case["scores"], min_size=case["min_size"])
     rep = report(case["metrics"], threshold=case["threshold"], fmt=case["fmt"])
     if case.get("fmt") == "json":
-        rep = json.loads(rep)
+        rep = _json_loads(rep)
     return {"normalize": norm, "report": rep}
 
 
-def _run_ruby_case(candidate: str, case: Dict[str, Any]) -> Dict[str, Any]:
-    temp_dir = Path(tempfile.mkdtemp(prefix="py2rb-oracle-"))
-    try:
-        candidate_path = temp_dir / "candidate.rb"
-        candidate_path.write_text(candidate, encoding="utf-8")
-        runner_path = temp_dir / "runner.rb"
-        runner_path.write_text(_RUBY_HARNESS, encoding="utf-8")
-        payload = json.dumps(case)
-        proc = subprocess.run(
-            ["ruby", str(runner_path), payload],
-            capture_output=True,
+class _Workspace:
+    """Per-oracle scratch space with one directory per Ruby candidate.
+
+    Retries often resubmit an identical candidate, so its directory (with
+    ``candidate.rb`` and ``runner.rb``) is reused instead of being written
+    and removed on every verify(). The oldest directories are pruned once
+    ``limit`` candidates are held; everything goes away with the oracle.
+    """
+
+    def __init__(self, limit: int = 32) -> None:
+        self._root = tempfile.TemporaryDirectory(prefix="py2rb-oracle-")
+        self._limit = limit
+        self._dirs: OrderedDict[str, Path] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def prepare(self, candidate: str) -> Path:
+        digest = hashlib.blake2b(
+            candidate.encode("utf-8"), digest_size=16
+        ).hexdigest()
+        with self._lock:
+            work_dir = self._dirs.get(digest)
+            if work_dir is not None:
+                self._dirs.move_to_end(digest)
+                return work_dir
+            work_dir = Path(self._root.name) / digest
+            work_dir.mkdir(exist_ok=True)
+            (work_dir / "candidate.rb").write_bytes(candidate.encode("utf-8"))
+            (work_dir / "runner.rb").write_bytes(_RUBY_HARNESS)
+            self._dirs[digest] = work_dir
+            if len(self._dirs) > self._limit:
+                _, stale = self._dirs.popitem(last=False)
+                shutil.rmtree(stale, ignore_errors=True)
+            return work_dir
+
+
+def _run_ruby_cases(
+    work_dir: Path, cases: List[Dict[str, Any]]
+) -> Tuple[List[Optional[Dict[str, Any]]], List[Dict[str, Any]]]:
+    outputs: List[Optional[Dict[str, Any]]] = []
+    errors: List[Dict[str, Any]] = []
+    # One interpreter per verify(): cases are streamed over stdin as JSON
+    # lines and each reply comes back as a single JSON line. stderr goes to
+    # an anonymous file since work_dir may be shared by concurrent runs.
+    with tempfile.TemporaryFile("w+", encoding="utf-8") as stderr:
+        proc = subprocess.Popen(
+            ["ruby", str(work_dir / "runner.rb")],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=stderr,
             text=True,
-            check=True,
         )
-        stdout = proc.stdout.strip()
-        if not stdout:
-            raise RuntimeError(
-                proc.stderr.strip() or "Ruby runner produced no output"
-            )
-        data = json.loads(stdout)
-        if case.get("fmt") == "json":
-            data["report"] = json.loads(data["report"])
-        return data
-    finally:
-        shutil.rmtree(temp_dir, ignore_errors=True)
-
-
-_RUBY_HARNESS = textwrap.dedent(
-    """
-    require "json"
-    require_relative "candidate"
+        try:
+            for idx, case in enumerate(cases):
+                try:
+                    outputs.append(_ruby_roundtrip(proc, case))
+                except _RubyCaseError as exc:
+                    outputs.append(None)
+                    errors.append({"case": case, "error": str(exc)})
+                except RuntimeError as exc:
+                    # The runner itself died (e.g. the candidate failed to
+                    # load), so none of the remaining cases can run.
+                    proc.kill()
+                    proc.wait()
+                    stderr.seek(0)
+                    message = stderr.read().strip() or str(exc)
+                    for pending in cases[idx:]:
+                        outputs.append(None)
+                        errors.append({"case": pending, "error": message})
+                    break
+        finally:
+            if proc.stdin is not None and not proc.stdin.closed:
+                try:
+                    proc.stdin.close()
+                except BrokenPipeError:
+                    pass
+        proc.wait()
+    return outputs, errors
+
 
-    payload = JSON.parse(ARGV[0])
+class _RubyCaseError(RuntimeError):
+    pass
+
+
+def _ruby_roundtrip(
+    proc: subprocess.Popen[str], case: Dict[str, Any]
+) -> Dict[str, Any]:
+    assert proc.stdin is not None and proc.stdout is not None
+    try:
+        proc.stdin.write(_json_dumps(case) + "\n")
+        proc.stdin.flush()
+    except BrokenPipeError:
+        raise RuntimeError("Ruby runner exited early") from None
+    line = proc.stdout.readline().strip()
+    if not line:
+        raise RuntimeError("Ruby runner produced no output")
+    data = _json_loads(line)
+    if "error" in data:
+        raise _RubyCaseError(data["error"])
+    if case.get("fmt") == "json":
+        data["report"] = _json_loads(data["report"])
+    return data
+
+
+_RUBY_HARNESS = b"""\
+require "json"
+
+# Replies go to the original stdout; anything the candidate prints is
+# redirected to stderr so it cannot corrupt the line protocol.
+reply = STDOUT.dup
+reply.sync = true
+STDOUT.reopen(STDERR)
+
+load File.join(__dir__, "candidate.rb")
+
+def call_entry(fn_name, *args, **kwargs)
+  if defined?(Report) && Report.respond_to?(fn_name)
+    return Report.public_send(fn_name, *args, **kwargs)
+  elsif respond_to?(fn_name)
+    return method(fn_name).call(*args, **kwargs)
+  else
+    raise "Unable to locate method '#{fn_name}'"
+  end
+end
+
+while (line = STDIN.gets)
+  begin
+    payload = JSON.parse(line)
     scores = payload["scores"]
     min_size = payload["min_size"]
     metrics = payload["metrics"]
     threshold = payload["threshold"]
     fmt = payload["fmt"]
 
-    def call_entry(fn_name, *args, **kwargs)
-      if defined?(Report) && Report.respond_to?(fn_name)
-        return Report.public_send(fn_name, *args, **kwargs)
-      elsif respond_to?(fn_name)
-        return method(fn_name).call(*args, **kwargs)
-      else
-        raise "Unable to locate method '#{fn_name}'"
-      end
-    end
-
     normalize = call_entry(:normalize_scores, scores, min_size: min_size)
-    report = call_entry(:generate_report, metrics, threshold: threshold, fmt: fmt)
-
-    puts JSON.generate({normalize: normalize, report: report})
-    """
-).strip()
+    report = call_entry(
+      :generate_report, metrics, threshold: threshold, fmt: fmt
+    )
+    reply.puts JSON.generate({normalize: normalize, report: report})
+  rescue StandardError => e
+    reply.puts JSON.generate({error: "#{e.class}: #{e.message}"})
+  end
+end
+"""
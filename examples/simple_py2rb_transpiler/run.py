@@ -13,6 +13,11 @@ from dotenv import load_dotenv
 
 from langformer import TranspilationOrchestrator
 
+try:  # pragma: no cover - depends on how PyYAML was built
+    from yaml import CSafeLoader as _Loader
+except ImportError:  # pragma: no cover - pure-Python fallback
+    from yaml import SafeLoader as _Loader  # type: ignore[assignment]
+
 DEFAULT_CONFIG = Path("configs/simple_py2rb.yaml")
 DEFAULT_SOURCE = Path(
     "examples/simple_py2rb_transpiler/inputs/sample_module.py"
@@ -61,7 +66,7 @@ def main() -> None:
             level=logging.INFO, format="%(levelname)s %(name)s: %(message)s"
         )
 
-    config_data = yaml.safe_load(args.config.read_text())
+    config_data = yaml.load(args.config.read_bytes(), Loader=_Loader)
     orchestrator = TranspilationOrchestrator(
         config_path=args.config,
         config=config_data,
@@ -9,9 +9,14 @@ pytest.importorskip(
     reason="DSPy is required for the DSPy Py→Rb example tests.",
 )
 
-from examples.dspy_py2rb_transpiler.agent import Py2RbDSPyTranspilerAgent
+from examples.dspy_py2rb_transpiler.agent import (
+    LangformerDSPyLM,
+    Py2RbDSPyTranspilerAgent,
+    _build_requirement_outline,
+)
 from examples.dspy_py2rb_transpiler.dspy_components import (
     DSPyFeedbackOptimizer,
+    Py2RbProgram,
 )
 from langformer.agents.base import LLMConfig
 from langformer.artifacts import ArtifactManager
@@ -53,7 +58,7 @@ class _Verifier:
 
     def verify(self, unit, candidate, ctx):
         self.calls += 1
-        text = next(iter(candidate.files.values()))
+        text = next(iter(candidate.files.values()), "")
         passed = self.keyword in text
         details = {"failures": []}
         if not passed:
@@ -150,3 +155,106 @@ def test_py2rb_dspy_agent_uses_optimizer(tmp_path: Path) -> None:
     assert verifier.calls == 2
     manifest = cfg.artifact_manager.manifest_for("unit")
     assert "transpiler" in manifest
+
+
+def test_dspy_lm_reuses_cached_responses(tmp_path: Path) -> None:
+    class _CountingProvider:
+        def __init__(self) -> None:
+            self.calls = 0
+
+        def generate(self, prompt: str, **kwargs):
+            self.calls += 1
+            return f"{prompt}:{self.calls}"
+
+    provider = _CountingProvider()
+    lm = LangformerDSPyLM(provider, cache_dir=tmp_path / "lm_cache")
+
+    first = lm.forward(prompt="translate")
+    second = lm.forward(prompt="translate")
+    other = lm.forward(prompt="translate", temperature=0.9)
+
+    assert provider.calls == 2
+    assert first.choices[0].message.content == "translate:1"
+    assert second.choices[0].message.content == "translate:1"
+    assert other.choices[0].message.content == "translate:2"
+
+
+def test_dspy_lm_cache_is_scoped_to_provider_model(tmp_path: Path) -> None:
+    class _ModelProvider:
+        def __init__(self, model_name: str) -> None:
+            self.model_name = model_name
+
+        def generate(self, prompt: str, **kwargs):
+            return f"{self.model_name}:{prompt}"
+
+    cache_dir = tmp_path / "lm_cache"
+    LangformerDSPyLM(_ModelProvider("old"), cache_dir=cache_dir).forward(
+        prompt="translate"
+    )
+
+    fresh = LangformerDSPyLM(
+        _ModelProvider("new"), cache_dir=cache_dir
+    ).forward(prompt="translate")
+
+    assert fresh.choices[0].message.content == "new:translate"
+
+
+def test_dspy_feedback_optimizer_dedupes_repeat_artifacts(
+    tmp_path: Path,
+) -> None:
+    manager = ArtifactManager(
+        ArtifactSettings(root=(tmp_path / "artifacts").resolve())
+    )
+    optimizer = DSPyFeedbackOptimizer(artifact_manager=manager)
+    note = {"failures": ["missing multiplier x2"]}
+
+    optimizer.record_feedback("unit", 1, note)
+    optimizer.record_feedback("unit", 2, note)
+
+    entries = manager.manifest_for("unit")["transpiler"]
+    assert len(entries) == 2
+    assert entries[0]["path"] == entries[1]["path"]
+    assert entries[1]["metadata"]["duplicate_of"] == 1
+    stage_dir = manager.stage_dir("transpiler", "unit")
+    assert not (stage_dir / "dspy_feedback_02.json").exists()
+
+
+def test_py2rb_program_uses_one_predictor_with_and_without_feedback() -> None:
+    program = Py2RbProgram()
+    calls: list[tuple[str, dict]] = []
+
+    def _stage(name: str):
+        def _run(**kwargs):
+            calls.append((name, kwargs))
+
+            class _Result:
+                summary = "summary"
+                output = name
+
+            return _Result()
+
+        return _run
+
+    program.summarize = _stage("summarize")
+    program.transpile = _stage("transpile")
+
+    first = program(source_code="x = 1", unit_metadata={})
+    refined = program(
+        source_code="x = 1",
+        unit_metadata={},
+        verification_feedback=[{"failures": ["boom"]}],
+    )
+
+    assert first.output == "transpile"
+    assert calls[1][1]["verification_feedback"] == ""
+    assert calls[1][1]["verifier_requirements"] == ""
+    assert refined.output == "transpile"
+    assert calls[-1][1]["verification_feedback"] == "Failures: boom"
+
+
+def test_requirement_outline_keeps_stdlib_json_formatting(
+    tmp_path: Path,
+) -> None:
+    outline = _build_requirement_outline(_ctx(tmp_path))
+
+    assert '{"values": [1, 2, 3]}' in outline["cases"][0]
@@ -0,0 +1,166 @@
+from __future__ import annotations
+
+import shutil
+import time
+
+from pathlib import Path
+
+import pytest
+
+from examples.dspy_py2rb_transpiler import oracle as oracle_module
+from examples.dspy_py2rb_transpiler.oracle import _build_oracle
+
+pytestmark = pytest.mark.skipif(
+    shutil.which("ruby") is None,
+    reason="Ruby interpreter is required for the DSPy Py→Rb oracle",
+)
+
+_EXAMPLE_DIR = Path(__file__).resolve().parents[1] / "dspy_py2rb_transpiler"
+SOURCE = (_EXAMPLE_DIR / "inputs" / "report_module.py").read_text()
+CANDIDATE = (_EXAMPLE_DIR / "outputs" / "report_module.rb").read_text()
+RUBY_TEST = _EXAMPLE_DIR / "tests" / "report_module_test.rb"
+
+
+@pytest.fixture(autouse=True)
+def _clear_verdict_cache():
+    oracle_module._VERIFIED_CACHE.clear()
+    yield
+    oracle_module._VERIFIED_CACHE.clear()
+
+
+@pytest.fixture()
+def ruby_case_calls(monkeypatch):
+    calls = []
+    run_cases = oracle_module._run_ruby_cases
+
+    def _counting(candidate_path, cases):
+        calls.append(candidate_path)
+        return run_cases(candidate_path, cases)
+
+    monkeypatch.setattr(oracle_module, "_run_ruby_cases", _counting)
+    return calls
+
+
+def test_oracle_accepts_matching_candidate() -> None:
+    oracle = _build_oracle({"ruby_tests": [str(RUBY_TEST)]})
+
+    result = oracle.verify(SOURCE, CANDIDATE, {"unit": "report"})
+
+    assert result.passed
+    assert result.details["unit"] == "report"
+    assert result.details["ruby_tests"][0]["status"] == "passed"
+
+
+def test_oracle_reports_syntax_error() -> None:
+    oracle = _build_oracle({})
+
+    result = oracle.verify(SOURCE, "module Report\n  def x(\nend\n", {})
+
+    assert not result.passed
+    assert result.details["syntax"]["passed"] is False
+
+
+def test_oracle_reports_case_exception() -> None:
+    candidate = CANDIDATE.replace(
+        'scale_scores(values).map(&:to_s).join(", ")', 'raise "boom"'
+    )
+    oracle = _build_oracle({})
+
+    result = oracle.verify(SOURCE, candidate, {})
+
+    assert not result.passed
+    assert "boom" in result.details["ruby_error"]
+
+
+def test_oracle_fail_fast_kills_remaining_tests(tmp_path: Path) -> None:
+    failing = tmp_path / "a_failing_test.rb"
+    failing.write_text("exit 1\n")
+    slow = tmp_path / "b_slow_test.rb"
+    slow.write_text("sleep 30\n")
+    oracle = _build_oracle({"ruby_tests": [str(failing), str(slow)]})
+
+    started = time.monotonic()
+    result = oracle.verify(SOURCE, CANDIDATE, {})
+
+    assert time.monotonic() - started < 15
+    assert not result.passed
+    assert [test["name"] for test in result.details["ruby_tests"]] == [
+        "a_failing_test.rb"
+    ]
+
+
+def test_oracle_caches_deterministic_verdicts(ruby_case_calls) -> None:
+    oracle = _build_oracle({})
+
+    assert oracle.verify(SOURCE, CANDIDATE, {}).passed
+    assert oracle.verify(SOURCE, CANDIDATE, {}).passed
+    assert len(ruby_case_calls) == 1
+
+    broken = "module Report\n  def x(\nend\n"
+    oracle.verify(SOURCE, broken, {})
+    oracle.verify(SOURCE, broken, {})
+    assert len(ruby_case_calls) == 3
+
+
+def test_oracle_cache_tracks_ruby_test_contents(
+    tmp_path: Path, ruby_case_calls
+) -> None:
+    ruby_test = tmp_path / "report_test.rb"
+    ruby_test.write_text("exit 0\n")
+    _build_oracle({"ruby_tests": [str(ruby_test)]}).verify(
+        SOURCE, CANDIDATE, {}
+    )
+
+    ruby_test.write_text("exit 1\n")
+    result = _build_oracle({"ruby_tests": [str(ruby_test)]}).verify(
+        SOURCE, CANDIDATE, {}
+    )
+
+    assert not result.passed
+    assert len(ruby_case_calls) == 2
+
+
+def test_oracle_cache_tracks_ruby_test_edits_while_alive(
+    tmp_path: Path,
+) -> None:
+    ruby_test = tmp_path / "report_test.rb"
+    ruby_test.write_text("exit 0\n")
+    oracle = _build_oracle({"ruby_tests": [str(ruby_test)]})
+    assert oracle.verify(SOURCE, CANDIDATE, {}).passed
+
+    ruby_test.write_text("exit 1\n")
+
+    assert not oracle.verify(SOURCE, CANDIDATE, {}).passed
+
+
+def test_oracle_cached_details_are_not_shared() -> None:
+    oracle = _build_oracle({"ruby_tests": [str(RUBY_TEST)]})
+    first = oracle.verify(SOURCE, CANDIDATE, {})
+    first.details["ruby_tests"].clear()
+    first.details["python"].append("tampered")
+
+    second = oracle.verify(SOURCE, CANDIDATE, {})
+
+    assert second.details["ruby_tests"]
+    assert "tampered" not in second.details["python"]
+
+
+def test_oracle_isolates_candidates() -> None:
+    patched = CANDIDATE + "\nclass Array\n  def map\n    []\n  end\nend\n"
+    oracle = _build_oracle({})
+
+    assert not oracle.verify(SOURCE, patched, {}).passed
+    assert oracle.verify(SOURCE, CANDIDATE, {}).passed
+
+
+def test_oracle_harness_is_private_and_removed_on_shutdown() -> None:
+    oracle_module._shutdown_ruby_server()
+    harness = oracle_module._harness_path()
+
+    assert harness.parent.stat().st_mode & 0o077 == 0
+    assert _build_oracle({}).verify(SOURCE, CANDIDATE, {}).passed
+
+    oracle_module._shutdown_ruby_server()
+    assert not harness.parent.exists()
+    oracle_module._VERIFIED_CACHE.clear()
+    assert _build_oracle({}).verify(SOURCE, CANDIDATE, {}).passed
@@ -1,3 +1,6 @@
+import filecmp
+
+from dataclasses import dataclass
 from pathlib import Path
 
 import pytest
@@ -10,9 +13,20 @@ pytest.importorskip(
 from examples.kernel_agent_delegate import (
     KernelAgentAutoPlanner,
     delegate as delegate_mod,
+    oracle as _ka_oracle,
 )
 from examples.kernel_agent_delegate.delegate import KernelAgentDelegate
-from langformer.preprocessing.delegates import ExecutionPlan
+from langformer.preprocessing.delegates import (
+    DelegateRegistry,
+    ExecutionDelegate,
+    ExecutionPlan,
+    load_delegate,
+)
+from langformer.preprocessing.planners import (
+    ExecutionPlanner,
+    PlannerRegistry,
+    load_planner,
+)
 from langformer.types import (
     CandidatePatchSet,
     IntegrationContext,
@@ -22,6 +36,13 @@ from langformer.types import (
 from langformer.verification.oracles import OracleRegistry
 
 
+@pytest.fixture(scope="module")
+def kernel_agent_factory():
+    factory = OracleRegistry.get_registry().get("kernel_agent_runner")
+    assert factory is not None
+    return factory
+
+
 def _base_config(run_root: Path, mode: str) -> dict:
     return {
         "examples": {"kernel_agent_delegate": {"mode": mode}},
@@ -88,7 +109,8 @@ def test_kernel_agent_delegate_pipeline_invokes_runner(monkeypatch, tmp_path: Pa
     exit_code = delegate.execute(source, target, run_root, plan, config)
 
     assert exit_code == 0
-    assert target.read_text() == composed.read_text()
+    # Byte comparison (with an early size check) instead of decoding both.
+    assert filecmp.cmp(target, composed, shallow=False)
     kwargs = captured["kwargs"]
     assert kwargs["problem_path"] == source.resolve()
     assert kwargs["workers"] == 2
@@ -142,24 +164,22 @@ def test_delegate_router_config_overrides(tmp_path: Path):
     assert pipeline_cfg["compose_model"] == "compose-z"
 
 
-def test_kernel_agent_oracle_invokes_runner(monkeypatch, tmp_path: Path):
-    registry = OracleRegistry.get_registry()
-    factory = registry.get("kernel_agent_runner")
-    assert factory is not None
-
+def test_kernel_agent_oracle_invokes_runner(
+    monkeypatch, tmp_path: Path, kernel_agent_factory
+):
     stdout = tmp_path / "stdout.txt"
     stderr = tmp_path / "stderr.txt"
     stdout.write_text("ALL_TESTS_PASSED\n")
     stderr.write_text("")
 
+    @dataclass(slots=True)
     class DummyResult:
-        def __init__(self) -> None:
-            self.rc = 0
-            self.passed = True
-            self.validator_used = "sentinel"
-            self.reason = "ALL_TESTS_PASSED"
-            self.stdout_path = stdout
-            self.stderr_path = stderr
+        stdout_path: Path
+        stderr_path: Path
+        rc: int = 0
+        passed: bool = True
+        validator_used: str = "sentinel"
+        reason: str = "ALL_TESTS_PASSED"
 
     captured = {}
 
@@ -180,14 +200,15 @@ def test_kernel_agent_oracle_invokes_runner(monkeypatch, tmp_path: Path):
                 "deny_network": deny_network,
             }
         )
-        return DummyResult()
+        return DummyResult(stdout_path=stdout, stderr_path=stderr)
 
     monkeypatch.setattr(
-        "examples.kernel_agent_delegate.oracle.run_candidate",
+        _ka_oracle,
+        "run_candidate",
         _fake_run_candidate,
     )
 
-    oracle = factory(
+    oracle = kernel_agent_factory(
         {
             "run_root": str(tmp_path / "ka_runs"),
             "timeout_s": 42,
@@ -207,9 +228,9 @@ def test_kernel_agent_oracle_invokes_runner(monkeypatch, tmp_path: Path):
 def test_kernel_agent_delegate_verify_uses_oracle(tmp_path: Path):
     delegate = KernelAgentDelegate({})
 
+    @dataclass(slots=True)
     class DummyOracle:
-        def __init__(self) -> None:
-            self.called = False
+        called: bool = False
 
         def verify(self, source_code: str, target_code: str, metadata):
             self.called = True
@@ -226,12 +247,13 @@ def test_kernel_agent_delegate_verify_uses_oracle(tmp_path: Path):
     assert oracle.called is True
 
 
-def test_kernel_agent_oracle_kernel_worker_mode(monkeypatch, tmp_path: Path):
-    registry = OracleRegistry.get_registry()
-    factory = registry.get("kernel_agent_runner")
-    assert factory is not None
-
+def test_kernel_agent_oracle_kernel_worker_mode(
+    monkeypatch, tmp_path: Path, kernel_agent_factory
+):
     class DummyWorker:
+        # State lives on the class; instances carry nothing.
+        __slots__ = ()
+
         def __init__(self, **kwargs):
             DummyWorker.kwargs = kwargs
 
@@ -244,7 +266,8 @@ def test_kernel_agent_oracle_kernel_worker_mode(monkeypatch, tmp_path: Path):
             return {"success": True, "rounds": 1, "history": []}
 
     monkeypatch.setattr(
-        "examples.kernel_agent_delegate.oracle.VerificationWorker",
+        _ka_oracle,
+        "VerificationWorker",
         DummyWorker,
     )
 
@@ -253,7 +276,7 @@ def test_kernel_agent_oracle_kernel_worker_mode(monkeypatch, tmp_path: Path):
     problem_path = tmp_path / "problem.txt"
     problem_path.write_text("problem\n", encoding="utf-8")
 
-    oracle = factory(
+    oracle = kernel_agent_factory(
         {
             "mode": "kernel_worker",
             "test_code_path": str(test_code_path),
@@ -264,3 +287,20 @@ def test_kernel_agent_oracle_kernel_worker_mode(monkeypatch, tmp_path: Path):
     result = oracle.verify("src", "print('target')", {"unit": "unit-2"})
     assert result.passed is True
     assert getattr(DummyWorker, "ran", False) is True
+
+
+def test_kernel_agent_registry_entries_are_component_classes(tmp_path: Path):
+    planner_cls = PlannerRegistry.get_registry().get("kernel_agent_auto")
+    delegate_cls = DelegateRegistry.get_registry().get("kernel_agent_delegate")
+    assert issubclass(planner_cls, ExecutionPlanner)
+    assert issubclass(delegate_cls, ExecutionDelegate)
+
+    source = tmp_path / "simple.py"
+    source.write_text("def main(x):\n    return x + 1\n")
+    planner = load_planner(
+        "kernel_agent_auto", {"cache_path": str(tmp_path / "cache.jsonl")}
+    )
+    assert planner.plan(source, {}).context["route"] == "kernel_agent"
+    assert isinstance(planner.cache_path, Path)
+    delegate = load_delegate("kernel_agent_delegate", {})
+    assert isinstance(delegate, ExecutionDelegate)
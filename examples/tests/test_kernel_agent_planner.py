@@ -51,3 +51,24 @@ def test_kernel_agent_planner_force_delegate(tmp_path: Path):
     plan = planner.plan(source, {})
     assert plan.action == "delegate"
     assert plan.context["delegate"] == "custom_delegate"
+
+
+def test_kernel_agent_planner_plan_many(tmp_path: Path):
+    first = tmp_path / "first.py"
+    first.write_text("def main(x):\n    return x + 1\n")
+    second = tmp_path / "second.py"
+    second.write_text("def main(x):\n    return x * 2\n")
+    missing = tmp_path / "missing.py"
+    planner = KernelAgentAutoPlanner(
+        {"cache_path": str(tmp_path / "cache.jsonl")}
+    )
+    plans = planner.plan_many([first, second, missing], {})
+    actions = [plan.action for plan in plans]
+    assert actions == ["delegate", "delegate", "transpile"]
+    assert plans[0].context["source"] == str(first)
+    assert plans[1].context["source"] == str(second)
+    assert plans[2].context["error"] == "missing_source"
+
+    cached = planner.plan_many([second, first], {})
+    sources = [plan.context["route_source"] for plan in cached]
+    assert sources == ["cache", "cache"]
@@ -0,0 +1,124 @@
+import os
+
+from pathlib import Path
+from types import SimpleNamespace
+
+from examples.kernel_agent_delegate import planner as planner_module
+from examples.kernel_agent_delegate.planner import KernelAgentAutoPlanner
+
+
+def test_router_construction_failure_is_retried(
+    tmp_path: Path, monkeypatch
+) -> None:
+    attempts = []
+
+    class _Router:
+        def __init__(self, **kwargs):
+            attempts.append(kwargs)
+            if len(attempts) == 1:
+                raise RuntimeError("missing API key")
+
+    planner_module._build_router.cache_clear()
+    monkeypatch.setattr(
+        planner_module,
+        "_auto_agent",
+        lambda: SimpleNamespace(AutoKernelRouter=_Router),
+    )
+    config = {
+        "cache_path": str(tmp_path / "cache.jsonl"),
+        "router": {"model": "router-model"},
+    }
+
+    try:
+        assert KernelAgentAutoPlanner(config)._ensure_router() is None
+        router = KernelAgentAutoPlanner(config)._ensure_router()
+        assert isinstance(router, _Router)
+        assert KernelAgentAutoPlanner(config)._ensure_router() is router
+        assert len(attempts) == 2
+    finally:
+        planner_module._build_router.cache_clear()
+
+
+def _entry(route: str) -> dict:
+    return {"route": route, "solver": route}
+
+
+def _lines(path: Path) -> list:
+    return [line for line in path.read_text().splitlines() if line]
+
+
+def test_cache_appends_one_line_per_decision(tmp_path: Path) -> None:
+    cache_path = tmp_path / "cache.jsonl"
+    planner = KernelAgentAutoPlanner({"cache_path": str(cache_path)})
+
+    for digest in ("a", "b", "a"):
+        planner._read_cache()[digest] = _entry("fuser")
+        planner._write_cache(digest, _entry("fuser"))
+
+    assert len(_lines(cache_path)) == 3
+    reloaded = KernelAgentAutoPlanner({"cache_path": str(cache_path)})
+    assert set(reloaded._read_cache()) == {"a", "b"}
+
+
+def test_cache_compacts_redundant_lines(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setattr(planner_module, "_COMPACT_MIN_LINES", 4)
+    cache_path = tmp_path / "cache.jsonl"
+    planner = KernelAgentAutoPlanner({"cache_path": str(cache_path)})
+
+    for route in ("fuser", "kernel_agent") * 3:
+        planner._read_cache()["a"] = _entry(route)
+        planner._write_cache("a", _entry(route))
+
+    assert len(_lines(cache_path)) <= 2
+    assert not cache_path.with_name("cache.jsonl.tmp").exists()
+    reloaded = KernelAgentAutoPlanner({"cache_path": str(cache_path)})
+    assert reloaded._read_cache() == {"a": _entry("kernel_agent")}
+
+
+def test_cache_rewrites_legacy_document(tmp_path: Path) -> None:
+    cache_path = tmp_path / "cache.json"
+    cache_path.write_text('{\n  "a": {\n    "route": "fuser"\n  }\n}\n')
+    planner = KernelAgentAutoPlanner({"cache_path": str(cache_path)})
+
+    planner._read_cache()["b"] = _entry("kernel_agent")
+    planner._write_cache("b", _entry("kernel_agent"))
+
+    assert len(_lines(cache_path)) == 2
+    reloaded = KernelAgentAutoPlanner({"cache_path": str(cache_path)})
+    assert set(reloaded._read_cache()) == {"a", "b"}
+
+
+def test_default_cache_migrates_legacy_file(
+    tmp_path: Path, monkeypatch
+) -> None:
+    monkeypatch.chdir(tmp_path)
+    legacy = tmp_path / ".fuse" / "router_cache.json"
+    legacy.parent.mkdir()
+    legacy.write_text('{\n  "a": {\n    "route": "fuser"\n  }\n}\n')
+    planner = KernelAgentAutoPlanner({})
+
+    assert planner.cache_path == Path(".fuse") / "router_cache.jsonl"
+    assert set(planner._read_cache()) == {"a"}
+    planner._read_cache()["b"] = _entry("kernel_agent")
+    planner._write_cache("b", _entry("kernel_agent"))
+
+    migrated = tmp_path / ".fuse" / "router_cache.jsonl"
+    assert len(_lines(migrated)) == 2
+    assert set(KernelAgentAutoPlanner({})._read_cache()) == {"a", "b"}
+
+
+def test_shared_cache_revalidates_on_mtime(tmp_path: Path) -> None:
+    cache_path = tmp_path / "cache.jsonl"
+    config = {"cache_path": str(cache_path)}
+    first = KernelAgentAutoPlanner(config)
+    first._read_cache()["a"] = _entry("fuser")
+    first._write_cache("a", _entry("fuser"))
+
+    second = KernelAgentAutoPlanner(config)
+    assert second._read_cache() is first._read_cache()
+
+    cache_path.write_text('{"b": {"route": "fuser"}}\n')
+    os.utime(cache_path, ns=(0, first._cache_mtime + 1))
+
+    assert set(second._read_cache()) == {"b"}
+    assert set(first._read_cache()) == {"b"}
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import copy
 import shutil
 
+from functools import lru_cache
 from pathlib import Path
 
 import pytest
@@ -10,6 +12,20 @@ import yaml
 from langformer import TranspilationOrchestrator
 from tests.simple_py2rb_stub import install_stubbed_transpiler
 
+try:  # pragma: no cover - depends on how PyYAML was built
+    from yaml import CSafeLoader as _Loader
+except ImportError:  # pragma: no cover - pure-Python fallback
+    from yaml import SafeLoader as _Loader  # type: ignore[assignment]
+
+
+_REPO_ROOT = Path(__file__).resolve().parents[2]
+_EXAMPLES_DIR = (_REPO_ROOT / "examples").resolve()
+
+
+@lru_cache(maxsize=8)
+def _load_cfg(path: str):
+    return yaml.load(Path(path).read_bytes(), Loader=_Loader)
+
 
 @pytest.mark.skipif(
     shutil.which("ruby") is None,
@@ -20,14 +36,10 @@ def test_simple_py2rb_transpiler(monkeypatch, tmp_path: Path):
 
     install_stubbed_transpiler(monkeypatch)
 
-    config = yaml.safe_load(
-        Path("configs/simple_py2rb.yaml").read_text()
-    )
+    config = copy.deepcopy(_load_cfg("configs/simple_py2rb.yaml"))
     config["transpilation"]["llm"] = {"provider": "echo"}
     plugin_cfg = config["transpilation"].setdefault("plugins", {})
-    repo_root = Path(__file__).resolve().parents[2]
-    examples_dir = repo_root / "examples"
-    plugin_cfg["paths"] = [str(examples_dir.resolve())]
+    plugin_cfg["paths"] = [str(_EXAMPLES_DIR)]
 
     orchestrator = TranspilationOrchestrator(config=config)
     target = tmp_path / "sample_module.rb"
@@ -1,15 +1,48 @@
 """Langformer package entry point."""
 
-from .exceptions import TranspilationAttemptError
-from .orchestrator import TranspilationOrchestrator
-from .types import (
-    CandidatePatchSet,
-    IntegrationContext,
-    LayoutPlan,
-    Oracle,
-    TranspileUnit,
-    VerifyResult,
-)
+from __future__ import annotations
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, List
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .exceptions import TranspilationAttemptError
+    from .orchestrator import TranspilationOrchestrator
+    from .types import (
+        CandidatePatchSet,
+        IntegrationContext,
+        LayoutPlan,
+        Oracle,
+        TranspileUnit,
+        VerifyResult,
+    )
+
+# The orchestrator pulls in the LLM providers, prompting and artifact
+# subsystems, so public names are resolved on first attribute access.
+_LAZY_EXPORTS = {
+    "CandidatePatchSet": ".types",
+    "IntegrationContext": ".types",
+    "LayoutPlan": ".types",
+    "Oracle": ".types",
+    "TranspileUnit": ".types",
+    "TranspilationOrchestrator": ".orchestrator",
+    "TranspilationAttemptError": ".exceptions",
+    "VerifyResult": ".types",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
+
 
 __all__ = [
     "CandidatePatchSet",
@@ -1,13 +1,50 @@
 """Exports for Langformer agent implementations."""
 
-from .analyzer import AnalyzerAgent, DefaultAnalyzerAgent
-from .base import LLMConfig
-from .transpiler import (
-    BasicDSPyTranspilerAgent,
-    DefaultTranspilerAgent,
-    TranspilerAgent,
-)
-from .verifier import DefaultVerificationAgent, VerifierAgent
+from __future__ import annotations
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, List
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .analyzer import AnalyzerAgent, DefaultAnalyzerAgent
+    from .base import LLMConfig
+    from .transpiler import (
+        BasicDSPyTranspilerAgent,
+        DefaultTranspilerAgent,
+        TranspilerAgent,
+    )
+    from .verifier import DefaultVerificationAgent, VerifierAgent
+
+# Submodules are imported on first attribute access so that importing one
+# agent (or ``langformer.agents.base``) does not load the others.
+_LAZY_EXPORTS = {
+    "LLMConfig": ".base",
+    "AnalyzerAgent": ".analyzer",
+    "DefaultAnalyzerAgent": ".analyzer",
+    "TranspilerAgent": ".transpiler",
+    "DefaultTranspilerAgent": ".transpiler",
+    "BasicDSPyTranspilerAgent": ".transpiler",
+    "VerifierAgent": ".verifier",
+    "DefaultVerificationAgent": ".verifier",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    # Bind every export of the submodule at once so siblings (e.g. the
+    # three transpiler names) never go back through this hook.
+    module = import_module(module_name, __name__)
+    for export, source in _LAZY_EXPORTS.items():
+        if source == module_name:
+            globals()[export] = getattr(module, export)
+    return globals()[name]
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
+
 
 __all__ = [
     "LLMConfig",
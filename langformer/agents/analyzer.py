@@ -2,14 +2,36 @@
 
 from __future__ import annotations
 
-from typing import Dict, List, Protocol, runtime_checkable
+import hashlib
+import threading
+
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional, Protocol, Tuple
 
 from langformer.agents.base import LLMConfig
 from langformer.languages.base import LanguagePlugin
 from langformer.types import TranspileUnit
 
+try:  # pragma: no cover - optional dependency
+    from blake3 import blake3 as _blake3
+except ImportError:  # pragma: no cover
+    _blake3 = None
+
+# Below this many sources the process pool start-up outweighs the parsing.
+_MIN_PARALLEL_BATCH = 4
+
+# Parsed trees keyed by (plugin class, source digest); refinement loops and
+# repeated runs re-analyze unchanged sources.
+_PARSE_CACHE: OrderedDict[Tuple[type, bytes], Any] = OrderedDict()
+_PARSE_CACHE_SIZE = 512
+_PARSE_LOCK = threading.Lock()
+
+# Per-worker state installed by ``_init_worker`` so the plugin is unpickled
+# once per process rather than once per item.
+_WORKER_STATE: Optional[Tuple[LanguagePlugin, Optional[Dict[str, Any]]]] = None
+
 
-@runtime_checkable
 class AnalyzerAgent(Protocol):
     """Protocol for agents that transform raw source into transpile units."""
 
@@ -40,28 +62,103 @@ class DefaultAnalyzerAgent:
     ) -> List[TranspileUnit]:
         """Run parsing and optionally return multiple transpile units."""
 
-        partitioned = self._language_plugin.partition_units(
+        return _analyze_source(
+            self._language_plugin,
+            self._config.get("analysis"),
             source_code,
             unit_id,
-            config=self._config.get("analysis"),
+            kind,
+        )
+
+    def analyze_batch(
+        self, items: List[Tuple[str, str]]
+    ) -> List[List[TranspileUnit]]:
+        """Analyze ``(source_code, unit_id)`` pairs, in parallel when large.
+
+        Parsing is CPU bound, so batches of at least four sources are fanned
+        out to a process pool sized by ``analysis.workers``. Results keep the
+        order of ``items``.
+        """
+
+        analysis_cfg = self._config.get("analysis")
+        if len(items) < _MIN_PARALLEL_BATCH:
+            return [
+                _analyze_source(
+                    self._language_plugin, analysis_cfg, source, unit_id
+                )
+                for source, unit_id in items
+            ]
+        workers = (analysis_cfg or {}).get("workers")
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(self._language_plugin, analysis_cfg),
+        ) as executor:
+            return list(executor.map(_parse_one, items, chunksize=8))
+
+
+def _init_worker(
+    plugin: LanguagePlugin, analysis_cfg: Optional[Dict[str, Any]]
+) -> None:
+    global _WORKER_STATE
+    _WORKER_STATE = (plugin, analysis_cfg)
+
+
+def _parse_one(item: Tuple[str, str]) -> List[TranspileUnit]:
+    assert _WORKER_STATE is not None
+    plugin, analysis_cfg = _WORKER_STATE
+    source_code, unit_id = item
+    return _analyze_source(plugin, analysis_cfg, source_code, unit_id)
+
+
+def _analyze_source(
+    plugin: LanguagePlugin,
+    analysis_cfg: Optional[Dict[str, Any]],
+    source_code: str,
+    unit_id: str,
+    kind: str = "module",
+) -> List[TranspileUnit]:
+    # ``analysis.partition_min_bytes`` lets sweeps over tiny fixtures skip
+    # the partition hook; unset keeps partitioning for every source.
+    min_bytes = (analysis_cfg or {}).get("partition_min_bytes")
+    if min_bytes is None or kind != "module" or len(source_code) >= min_bytes:
+        partitioned = plugin.partition_units(
+            source_code, unit_id, config=analysis_cfg
         )
         if partitioned:
             return partitioned
 
-        ast_tree = self._safe_parse(source_code)
-        return [
-            TranspileUnit(
-                id=unit_id,
-                language=self._language_plugin.name,
-                kind=kind,
-                source_code=source_code,
-                source_ast=ast_tree,
-                metadata={"analyzer": "basic"},
-            )
-        ]
-
-    def _safe_parse(self, source_code: str):
-        try:
-            return self._language_plugin.parse(source_code)
-        except Exception:  # pragma: no cover
-            return None
+    return [
+        TranspileUnit(
+            id=unit_id,
+            language=plugin.name,
+            kind=kind,
+            source_code=source_code,
+            source_ast=_safe_parse(plugin, source_code),
+            metadata={"analyzer": "basic"},
+        )
+    ]
+
+
+def _source_digest(source_code: str) -> bytes:
+    data = source_code.encode("utf-8", "surrogatepass")
+    if _blake3 is not None:
+        return _blake3(data).digest(length=16)
+    return hashlib.blake2b(data, digest_size=16).digest()
+
+
+def _safe_parse(plugin: LanguagePlugin, source_code: str):
+    key = (type(plugin), _source_digest(source_code))
+    with _PARSE_LOCK:
+        if key in _PARSE_CACHE:
+            _PARSE_CACHE.move_to_end(key)
+            return _PARSE_CACHE[key]
+    try:
+        tree = plugin.parse(source_code)
+    except Exception:  # pragma: no cover
+        tree = None
+    with _PARSE_LOCK:
+        _PARSE_CACHE[key] = tree
+        if len(_PARSE_CACHE) > _PARSE_CACHE_SIZE:
+            _PARSE_CACHE.popitem(last=False)
+    return tree
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import asyncio
+import inspect
 import json
 import logging
 
@@ -11,15 +13,18 @@ from typing import (
     Any,
     Callable,
     Dict,
+    List,
     Mapping,
     Optional,
     Protocol,
+    Tuple,
     runtime_checkable,
 )
 
 from langformer.agents.base import LLMConfig
 from langformer.exceptions import TranspilationAttemptError
 from langformer.languages.base import LanguagePlugin
+from langformer.llm.cache import PromptCache, prompt_cache_key
 from langformer.prompting.backends.base import PromptRenderer
 from langformer.prompting.backends.dspy_backend import BasicDSPyTranspiler
 from langformer.prompting.backends.jinja_backend import JinjaPromptRenderer
@@ -28,23 +33,88 @@ from langformer.prompting.registry import get_renderer
 from langformer.prompting.types import (
     PromptTaskResult,
     PromptTaskSpec,
+    RenderedPrompt,
 )
-from langformer.runtime.parallel import ParallelExplorer
+from langformer.runtime.dedup import code_digest
+from langformer.runtime.parallel import LinkedEvent, ParallelExplorer
 from langformer.types import (
     CandidatePatchSet,
     IntegrationContext,
+    TranspilerMetadata,
     TranspileUnit,
 )
 
+try:  # pragma: no cover - optional dependency
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
 if TYPE_CHECKING:  # pragma: no cover - circular import guard
     from langformer.agents.verifier import VerifierAgent
 
+_LOGGER = logging.getLogger(__name__)
+
 EventAdapterFactory = Callable[
     [TranspileUnit, IntegrationContext, int, Optional[str]], Any
 ]
+_FirstRender = Tuple[PromptTaskSpec, RenderedPrompt]
+# (code, attempt, variant label) -> dedup info. Handlers that also accept a
+# ``digest`` keyword receive the candidate's precomputed ``code_digest``.
 DedupHandler = Callable[[str, int, Optional[str]], Optional[Dict[str, Any]]]
 
 
+def _dumps(payload: Any) -> str:
+    # Feedback can carry large tracebacks/diffs; orjson serializes them much
+    # faster than the stdlib encoder on every failed attempt.
+    if orjson is not None:
+        try:
+            return orjson.dumps(payload).decode("utf-8")
+        except TypeError:
+            # orjson rejects some inputs stdlib json accepts (e.g. int keys).
+            pass
+    return json.dumps(payload)
+
+
+def _accepts_digest(handler: Optional[DedupHandler]) -> bool:
+    if handler is None:
+        return False
+    try:
+        params = inspect.signature(handler).parameters
+    except (TypeError, ValueError):  # pragma: no cover - builtins
+        return False
+    return "digest" in params or any(
+        param.kind is inspect.Parameter.VAR_KEYWORD
+        for param in params.values()
+    )
+
+
+def _attempt_notes(
+    attempt: int,
+    prompt_task: Dict[str, Any],
+    task_result: PromptTaskResult,
+    variant_label: Optional[str],
+    stream_details: Optional[Mapping[str, Any]] = None,
+) -> TranspilerMetadata:
+    # Built once per attempt and wrapped up front so CandidatePatchSet does
+    # not have to convert a plain dict again.
+    notes: Dict[str, Any] = {
+        "attempt": attempt,
+        "prompt_task": prompt_task,
+        "prompt_result": {
+            "output_type": task_result.output_type,
+            "source": task_result.metadata.get("source"),
+        },
+    }
+    if variant_label:
+        notes["variant"] = variant_label
+    if stream_details is not None:
+        notes["stream"] = {
+            "response_id": stream_details.get("response_id"),
+            "error": stream_details.get("error"),
+        }
+    return TranspilerMetadata(notes)
+
+
 @runtime_checkable
 class TranspilerAgent(Protocol):
     """Protocol for agents that turn units into candidate patch sets."""
@@ -79,16 +149,39 @@ class DefaultTranspilerAgent:
         event_adapter_factory: Optional[EventAdapterFactory] = None,
         prompt_renderer: PromptRenderer | None = None,
         prompt_template_map: Optional[Mapping[str, str]] = None,
+        prompt_cache: Optional[PromptCache] = None,
     ) -> None:
         self._source_plugin = source_plugin
         self._target_plugin = target_plugin
         self._llm_config = llm_config
         self._provider = llm_config.provider
+        # Accepted completions keyed by (prompt, temperature); a hit skips
+        # the provider round trip for a prompt that already produced code.
+        self._prompt_cache = prompt_cache
+        # Only plugins that override the hook pay for joining partial output.
+        self._prefix_check: Optional[Callable[[str], bool]] = (
+            target_plugin.quick_prefix_ok
+            if type(target_plugin).quick_prefix_ok
+            is not LanguagePlugin.quick_prefix_ok
+            else None
+        )
         self._prompt_manager = llm_config.prompt_manager
         self._artifact_manager = llm_config.artifact_manager
         self._max_retries = max(1, max_retries)
         self._parallel_workers = max(1, parallel_workers)
         self._temperature_range = temperature_range
+        # Attempt/worker index -> temperature, ramping from low to high over
+        # the retry budget; larger indices clamp to the last entry.
+        low, high = temperature_range
+        steps = max(1, self._max_retries - 1)
+        self._temperatures = tuple(
+            low
+            if self._max_retries <= 1
+            else low + (high - low) * min(1.0, idx / steps)
+            for idx in range(
+                max(self._max_retries, self._parallel_workers) + 1
+            )
+        )
         provider_name = getattr(
             llm_config.provider, "__class__", type(llm_config.provider)
         ).__name__
@@ -105,12 +198,11 @@ class DefaultTranspilerAgent:
                 if model_name
                 else inner_name
             )
-        self._logger = logging.getLogger(__name__)
-        self._logger.info(
+        _LOGGER.info(
             "DefaultTranspilerAgent using provider %s", provider_name
         )
         if provider_name.lower().startswith("echoprovider"):
-            self._logger.warning(
+            _LOGGER.warning(
                 "LLM provider is EchoProvider; outputs will mirror prompts "
                 "until a real provider is configured."
             )
@@ -122,10 +214,14 @@ class DefaultTranspilerAgent:
         }
         if prompt_template_map:
             default_template_map.update(prompt_template_map)
-        self._prompt_renderer = prompt_renderer or JinjaPromptRenderer(
-            self._prompt_manager,
-            template_map=default_template_map,
-        )
+        if prompt_renderer is None:
+            jinja_renderer = JinjaPromptRenderer(
+                self._prompt_manager,
+                template_map=default_template_map,
+            )
+            jinja_renderer.preload(default_template_map)
+            prompt_renderer = jinja_renderer
+        self._prompt_renderer = prompt_renderer
 
     def transpile(
         self,
@@ -155,27 +251,189 @@ class DefaultTranspilerAgent:
                 cancel_event=cancel_event,
             )
 
-        attempt_funcs = [
+        # Private to this call and shared with every worker, so the explorer
+        # can stop the others (and their provider calls) once one candidate
+        # verifies; the caller's own event is only observed, never set.
+        stop_event = LinkedEvent(cancel_event)
+        first_render, first_outputs = self._prepare_first_attempt(
+            unit, ctx, factory
+        )
+        attempt_funcs = self._parallel_attempt_funcs(
+            unit,
+            ctx,
+            target_path,
+            verifier,
+            event_factory=factory,
+            variant_label=variant_label,
+            dedup_handler=dedup_handler,
+            cancel_event=stop_event,
+            first_render=first_render,
+            first_outputs=first_outputs,
+        )
+        candidate = self._explorer.explore(
+            attempt_funcs, stop_event=stop_event
+        )
+        if candidate is None:
+            raise TranspilationAttemptError(
+                f"All parallel attempts failed for unit {unit.id}"
+            )
+        return candidate
+
+    async def atranspile(
+        self,
+        unit: TranspileUnit,
+        ctx: IntegrationContext,
+        verifier: "VerifierAgent | None" = None,
+        *,
+        event_factory: Optional[EventAdapterFactory] = None,
+        variant_label: Optional[str] = None,
+        dedup_handler: Optional[DedupHandler] = None,
+        cancel_event: Optional[Any] = None,
+    ) -> CandidatePatchSet:
+        """Awaitable ``transpile`` that keeps provider waits off the loop."""
+
+        if verifier is None or self._parallel_workers == 1:
+            return await asyncio.to_thread(
+                self.transpile,
+                unit,
+                ctx,
+                verifier,
+                event_factory=event_factory,
+                variant_label=variant_label,
+                dedup_handler=dedup_handler,
+                cancel_event=cancel_event,
+            )
+
+        factory = event_factory or self._event_factory
+        stop_event = LinkedEvent(cancel_event)
+        first_render, first_outputs = await asyncio.to_thread(
+            self._prepare_first_attempt, unit, ctx, factory
+        )
+        attempt_funcs = self._parallel_attempt_funcs(
+            unit,
+            ctx,
+            ctx.layout.target_path(unit.id),
+            verifier,
+            event_factory=factory,
+            variant_label=variant_label,
+            dedup_handler=dedup_handler,
+            cancel_event=stop_event,
+            first_render=first_render,
+            first_outputs=first_outputs,
+        )
+        candidate = await self._explorer.explore_async(
+            attempt_funcs,
+            max_concurrency=self._parallel_workers,
+            stop_event=stop_event,
+        )
+        if candidate is None:
+            raise TranspilationAttemptError(
+                f"All parallel attempts failed for unit {unit.id}"
+            )
+        return candidate
+
+    def _parallel_attempt_funcs(
+        self,
+        unit: TranspileUnit,
+        ctx: IntegrationContext,
+        target_path: Path,
+        verifier: "VerifierAgent | None",
+        *,
+        event_factory: Optional[EventAdapterFactory],
+        variant_label: Optional[str],
+        dedup_handler: Optional[DedupHandler],
+        cancel_event: Optional[Any],
+        first_render: Optional[_FirstRender] = None,
+        first_outputs: Optional[List[str]] = None,
+    ) -> List[Callable[[], CandidatePatchSet]]:
+        return [
             lambda idx=idx: self._sequential_attempts(
                 unit,
                 ctx,
                 target_path,
                 verifier,
                 temp=self._pick_temperature(idx),
-                event_factory=factory,
+                event_factory=event_factory,
                 variant_label=(variant_label or "parallel") + f"_{idx:02d}",
                 dedup_handler=dedup_handler,
                 cancel_event=cancel_event,
+                first_render=first_render,
+                first_output=first_outputs[idx] if first_outputs else None,
             )
             for idx in range(self._parallel_workers)
         ]
 
-        candidate = self._explorer.explore(attempt_funcs)
-        if candidate is None:
-            raise TranspilationAttemptError(
-                f"All parallel attempts failed for unit {unit.id}"
+    def _prepare_first_attempt(
+        self,
+        unit: TranspileUnit,
+        ctx: IntegrationContext,
+        event_factory: Optional[EventAdapterFactory],
+    ) -> Tuple[_FirstRender, Optional[List[str]]]:
+        # Every worker starts from the same first prompt, so it is rendered
+        # once (instead of once per worker) and handed to all of them. The
+        # only provider work done here is the single batched request, when
+        # one applies; otherwise each worker generates from the shared
+        # render concurrently.
+        first_render = self._render_first_prompt(unit, ctx)
+        return first_render, self._batched_first_outputs(
+            unit, first_render, event_factory
+        )
+
+    def _render_first_prompt(
+        self, unit: TranspileUnit, ctx: IntegrationContext
+    ) -> _FirstRender:
+        task_spec = build_prompt_task_spec(
+            self._source_plugin,
+            self._target_plugin,
+            unit,
+            ctx,
+            None,
+            1,
+            None,
+        )
+        renderer = get_renderer(task_spec.kind) or self._prompt_renderer
+        return task_spec, renderer.render(task_spec)
+
+    def _batched_first_outputs(
+        self,
+        unit: TranspileUnit,
+        first_render: _FirstRender,
+        event_factory: Optional[EventAdapterFactory],
+    ) -> Optional[List[str]]:
+        # Every worker's first attempt renders the same prompt, so when all
+        # samples share a temperature a provider with native multi-choice
+        # support serves them in one request. Otherwise (distinct
+        # temperatures, no batching support, streaming adapters) the
+        # workers keep generating concurrently, which is faster than any
+        # up-front sequence of calls.
+        generate_batch = getattr(self._provider, "generate_batch", None)
+        supports_batching = getattr(self._provider, "supports_batching", None)
+        if (
+            generate_batch is None
+            or supports_batching is None
+            or event_factory is not None
+        ):
+            return None
+        temperatures = [
+            self._pick_temperature(idx)
+            for idx in range(self._parallel_workers)
+        ]
+        if len(set(temperatures)) != 1 or not supports_batching():
+            return None
+        prompt = first_render[1].message.content
+        try:
+            outputs = generate_batch(
+                prompt,
+                n=self._parallel_workers,
+                temperatures=temperatures,
+                metadata={"source_code": unit.source_code or ""},
             )
-        return candidate
+        except Exception as exc:  # pragma: no cover - per-worker fallback
+            _LOGGER.warning("Batched generation failed: %s", exc)
+            return None
+        if len(outputs) != self._parallel_workers:
+            return None
+        return list(outputs)
 
     def verify(self, unit, candidate, ctx):  # pragma: no cover - legacy hook
         raise NotImplementedError("Verifier is handled by VerifierAgent")
@@ -192,9 +450,13 @@ class DefaultTranspilerAgent:
         variant_label: Optional[str] = None,
         dedup_handler: Optional[DedupHandler] = None,
         cancel_event: Optional[Any] = None,
+        first_render: Optional[_FirstRender] = None,
+        first_output: Optional[str] = None,
     ) -> CandidatePatchSet:
         feedback: Optional[str] = None
         previous_code: Optional[str] = None
+        fill_cache: Dict[Any, Dict[str, object]] = {}
+        pass_digest = _accepts_digest(dedup_handler)
         for attempt in range(1, self._max_retries + 1):
             if (
                 cancel_event is not None
@@ -203,49 +465,40 @@ class DefaultTranspilerAgent:
                 raise TranspilationAttemptError(
                     "Transpiler canceled by orchestrator"
                 )
-            task_spec = build_prompt_task_spec(
-                self._source_plugin,
-                self._target_plugin,
-                unit,
-                ctx,
-                feedback,
-                attempt,
-                previous_code,
-            )
-            renderer = get_renderer(task_spec.kind) or self._prompt_renderer
-            rendered_prompt = renderer.render(task_spec)
+            if attempt == 1 and first_render is not None:
+                task_spec, rendered_prompt = first_render
+            else:
+                task_spec = build_prompt_task_spec(
+                    self._source_plugin,
+                    self._target_plugin,
+                    unit,
+                    ctx,
+                    feedback,
+                    attempt,
+                    previous_code,
+                    fill_cache,
+                )
+                renderer = (
+                    get_renderer(task_spec.kind) or self._prompt_renderer
+                )
+                rendered_prompt = renderer.render(task_spec)
             prompt = rendered_prompt.message.content
-            adapter_instance: Optional[Any] = None
-            if event_factory is not None:
-                try:
-                    adapter_instance = event_factory(
-                        unit, ctx, attempt, variant_label
-                    )
-                except Exception as exc:  # pragma: no cover - defensive
-                    self._logger.warning(
-                        "Failed to initialize event adapter: %s", exc
-                    )
             stream_details: Optional[dict[str, Any]] = None
-            if adapter_instance is not None:
-                try:
-                    stream_details = adapter_instance.stream(
-                        system_prompt=(
-                            "You are a careful transpilation assistant."
-                        ),
-                        user_prompt=prompt,
-                        extras={
-                            "metadata": {
-                                "unit": unit.id,
-                                "attempt": attempt,
-                                "variant": variant_label or "main",
-                            }
-                        },
-                    )
-                except Exception as exc:  # pragma: no cover
-                    self._logger.warning(
-                        "Event streaming failed: %s", exc
-                    )
-                    stream_details = {"error": str(exc)}
+            cache_key: Optional[str] = None
+            if event_factory is not None:
+                stream_details = self._run_stream(
+                    event_factory, unit, ctx, attempt, variant_label, prompt
+                )
+            if stream_details is not None and stream_details.get("aborted"):
+                # The partial output already failed the target plugin's
+                # prefix check; count it as a failed attempt.
+                feedback = _dumps(
+                    {
+                        "reason": "early_abort",
+                        "detail": stream_details["aborted"],
+                    }
+                )
+                continue
             if stream_details is not None and stream_details.get("output_text"):
                 task_result = PromptTaskResult(
                     output_type="code",
@@ -257,12 +510,23 @@ class DefaultTranspilerAgent:
                 )
             else:
                 temperature_value = temp or self._pick_temperature(attempt)
+                generation_source = "provider"
+                cached_output: Optional[str] = None
+                if self._prompt_cache is not None:
+                    cache_key = prompt_cache_key(prompt, temperature_value)
+                    cached_output = self._prompt_cache.get(cache_key)
                 try:
-                    generated = self._provider.generate(
-                        prompt,
-                        metadata={"source_code": unit.source_code or ""},
-                        temperature=temperature_value,
-                    )
+                    if cached_output is not None:
+                        generated = cached_output
+                        generation_source = "prompt_cache"
+                    elif attempt == 1 and first_output is not None:
+                        generated = first_output
+                    else:
+                        generated = self._provider.generate(
+                            prompt,
+                            metadata={"source_code": unit.source_code or ""},
+                            temperature=temperature_value,
+                        )
                 except Exception as exc:  # pragma: no cover
                     provider_name = getattr(
                         getattr(self._provider, "__class__", None),
@@ -276,40 +540,34 @@ class DefaultTranspilerAgent:
                     output_type="code",
                     output=generated or "",
                     metadata={
-                        "source": "provider",
+                        "source": generation_source,
                         "temperature": temperature_value,
                     },
                 )
             code = task_result.output or ""
-            notes: dict[str, Any] = {
-                "attempt": attempt,
-                "prompt_task": {
-                    "kind": task_spec.kind,
-                },
-                "prompt_result": {
-                    "output_type": task_result.output_type,
-                    "source": task_result.metadata.get("source"),
-                },
-            }
-            notes["prompt_task"]["template"] = rendered_prompt.template
-            if variant_label:
-                notes["variant"] = variant_label
-            if stream_details is not None:
-                notes["stream"] = {
-                    "response_id": stream_details.get("response_id"),
-                    "error": stream_details.get("error"),
-                }
+            notes = _attempt_notes(
+                attempt,
+                {"kind": task_spec.kind, "template": rendered_prompt.template},
+                task_result,
+                variant_label,
+                stream_details,
+            )
             dedup_info = None
             if dedup_handler is not None:
                 try:
-                    dedup_info = dedup_handler(code, attempt, variant_label)
+                    dedup_kwargs = (
+                        {"digest": code_digest(code)} if pass_digest else {}
+                    )
+                    dedup_info = dedup_handler(
+                        code, attempt, variant_label, **dedup_kwargs
+                    )
                 except Exception as exc:  # pragma: no cover - defensive
                     dedup_info = {"status": "error", "error": str(exc)}
                 if dedup_info:
                     notes["dedup"] = dedup_info
                     status = dedup_info.get("status")
                     if status == "duplicate_same_worker":
-                        feedback = json.dumps(
+                        feedback = _dumps(
                             {
                                 "reason": "duplicate_same_worker",
                                 "dedup": dedup_info,
@@ -326,26 +584,78 @@ class DefaultTranspilerAgent:
             )
             previous_code = code
             if verifier is None:
+                self._remember(cache_key, task_result, code)
                 return candidate
 
             result = verifier.verify(unit, candidate, ctx)
             verification_note = result.feedback.to_dict()
             candidate.notes["verification"] = verification_note
             if result.passed:
+                self._remember(cache_key, task_result, code)
                 return candidate
-            feedback = json.dumps(verification_note)
+            feedback = _dumps(verification_note)
 
         raise TranspilationAttemptError(
             f"Failed to transpile unit {unit.id} within retry budget"
         )
 
+    def _run_stream(
+        self,
+        event_factory: EventAdapterFactory,
+        unit: TranspileUnit,
+        ctx: IntegrationContext,
+        attempt: int,
+        variant_label: Optional[str],
+        prompt: str,
+    ) -> Optional[dict[str, Any]]:
+        # Kept out of the attempt loop so bulk runs without an event factory
+        # never build the adapter kwargs.
+        try:
+            adapter_instance = event_factory(unit, ctx, attempt, variant_label)
+        except Exception as exc:  # pragma: no cover - defensive
+            _LOGGER.warning("Failed to initialize event adapter: %s", exc)
+            return None
+        if adapter_instance is None:
+            return None
+        if (
+            self._prefix_check is not None
+            and getattr(adapter_instance, "prefix_check", False) is None
+        ):
+            adapter_instance.prefix_check = self._prefix_check
+        try:
+            return adapter_instance.stream(
+                system_prompt="You are a careful transpilation assistant.",
+                user_prompt=prompt,
+                extras={
+                    "metadata": {
+                        "unit": unit.id,
+                        "attempt": attempt,
+                        "variant": variant_label or "main",
+                    }
+                },
+            )
+        except Exception as exc:  # pragma: no cover
+            _LOGGER.warning("Event streaming failed: %s", exc)
+            return {"error": str(exc)}
+
+    def _remember(
+        self,
+        cache_key: Optional[str],
+        task_result: PromptTaskResult,
+        code: str,
+    ) -> None:
+        # Only provider output that was accepted is worth replaying.
+        if (
+            self._prompt_cache is None
+            or cache_key is None
+            or task_result.metadata.get("source") != "provider"
+        ):
+            return
+        self._prompt_cache.put(cache_key, code)
+
     def _pick_temperature(self, idx: int) -> float:
-        low, high = self._temperature_range
-        if self._max_retries <= 1:
-            return low
-        span = high - low
-        fraction = min(1.0, idx / max(1, self._max_retries - 1))
-        return low + span * fraction
+        temps = self._temperatures
+        return temps[idx] if idx < len(temps) else temps[-1]
 
 
 class BasicDSPyTranspilerAgent:
@@ -381,8 +691,7 @@ class BasicDSPyTranspilerAgent:
         self._max_retries = max(1, max_retries)
         self._explorer = ParallelExplorer()
         self._event_factory = event_adapter_factory
-        self._logger = logging.getLogger(__name__)
-        self._logger.info(
+        _LOGGER.info(
             "BasicDSPyTranspilerAgent initialized with engine %s",
             type(self._engine).__name__,
         )
@@ -411,6 +720,7 @@ class BasicDSPyTranspilerAgent:
                 cancel_event=cancel_event,
             )
 
+        stop_event = LinkedEvent(cancel_event)
         attempt_funcs = [
             lambda: self._sequential_attempts(
                 unit,
@@ -419,11 +729,13 @@ class BasicDSPyTranspilerAgent:
                 event_factory=event_factory or self._event_factory,
                 variant_label=variant_label,
                 dedup_handler=dedup_handler,
-                cancel_event=cancel_event,
+                cancel_event=stop_event,
             )
             for _ in range(self._max_retries)
         ]
-        candidate = self._explorer.explore(attempt_funcs)
+        candidate = self._explorer.explore(
+            attempt_funcs, stop_event=stop_event
+        )
         if candidate is None:
             raise TranspilationAttemptError(
                 f"DSPy engine failed for unit {unit.id}"
@@ -444,6 +756,8 @@ class BasicDSPyTranspilerAgent:
         target_path = ctx.layout.target_path(unit.id)
         feedback: Optional[str] = None
         previous_code: Optional[str] = None
+        fill_cache: Dict[Any, Dict[str, object]] = {}
+        pass_digest = _accepts_digest(dedup_handler)
         for attempt in range(1, self._max_retries + 1):
             if (
                 cancel_event is not None
@@ -458,6 +772,7 @@ class BasicDSPyTranspilerAgent:
                 feedback,
                 attempt,
                 previous_code,
+                fill_cache,
             )
             result = self._engine.run(task_spec)
             code = result.output or ""
@@ -465,30 +780,31 @@ class BasicDSPyTranspilerAgent:
                 raise TranspilationAttemptError(
                     f"DSPy engine returned no output for unit {unit.id}"
                 )
-            notes: dict[str, Any] = {
-                "attempt": attempt,
-                "prompt_task": {
+            notes = _attempt_notes(
+                attempt,
+                {
                     "kind": task_spec.kind,
                     "engine": type(self._engine).__name__,
                 },
-                "prompt_result": {
-                    "output_type": result.output_type,
-                    "source": result.metadata.get("source"),
-                },
-            }
-            if variant_label:
-                notes["variant"] = variant_label
+                result,
+                variant_label,
+            )
             dedup_info = None
             if dedup_handler is not None:
                 try:
-                    dedup_info = dedup_handler(code, attempt, variant_label)
+                    dedup_kwargs = (
+                        {"digest": code_digest(code)} if pass_digest else {}
+                    )
+                    dedup_info = dedup_handler(
+                        code, attempt, variant_label, **dedup_kwargs
+                    )
                 except Exception as exc:  # pragma: no cover - defensive
                     dedup_info = {"status": "error", "error": str(exc)}
                 if dedup_info:
                     notes["dedup"] = dedup_info
                     status = dedup_info.get("status")
                     if status == "duplicate_same_worker":
-                        feedback = json.dumps(
+                        feedback = _dumps(
                             {
                                 "reason": "duplicate_same_worker",
                                 "dedup": dedup_info,
@@ -511,7 +827,7 @@ class BasicDSPyTranspilerAgent:
             self._after_verification(unit, attempt, verification_note)
             if verifier_result.passed:
                 return candidate
-            feedback = json.dumps(verification_note)
+            feedback = _dumps(verification_note)
         raise TranspilationAttemptError(
             f"DSPy engine failed to transpile unit {unit.id} within retry budget"
         )
@@ -523,6 +839,7 @@ class BasicDSPyTranspilerAgent:
         feedback: Optional[str],
         attempt: int,
         previous_code: Optional[str],
+        fill_cache: Optional[Dict[Any, Dict[str, object]]] = None,
     ) -> PromptTaskSpec:
         spec = build_prompt_task_spec(
             self._source_plugin,
@@ -532,6 +849,7 @@ class BasicDSPyTranspilerAgent:
             feedback,
             attempt,
             previous_code,
+            fill_cache,
         )
         overrides = self._metadata_overrides(unit, attempt, ctx)
         if overrides:
@@ -563,7 +881,13 @@ def build_prompt_task_spec(
     feedback: Optional[str],
     attempt: int,
     previous_code: Optional[str],
+    fill_cache: Optional[Dict[Any, Dict[str, object]]] = None,
 ) -> PromptTaskSpec:
+    """Build the prompt spec for one attempt.
+
+    Callers looping over attempts for the same unit and context can pass
+    the same ``fill_cache`` dict so per-unit prompt fills run only once.
+    """
     kind = "transpile_initial" if feedback is None else "transpile_refine"
     previous_snapshot = previous_code or unit.source_code or ""
     fill_context = PromptFillContext(
@@ -577,7 +901,7 @@ def build_prompt_task_spec(
         source_plugin=source_plugin,
         target_plugin=target_plugin,
     )
-    payload = prompt_fills.build_payload(fill_context)
+    payload = prompt_fills.build_payload(fill_context, cache=fill_cache)
     base_context = {
         "source_language": source_plugin.name,
         "target_language": target_plugin.name,
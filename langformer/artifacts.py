@@ -2,9 +2,24 @@
 
 from __future__ import annotations
 
+import os
+import threading
+
+from collections import defaultdict
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional
+from types import MappingProxyType
+from typing import (
+    Any,
+    DefaultDict,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Set,
+    Tuple,
+)
 
 from langformer.configuration import ArtifactSettings
 from langformer.constants import (
@@ -13,14 +28,45 @@ from langformer.constants import (
     ARTIFACT_STAGE_VERIFIER,
 )
 
+ManifestView = Mapping[str, Tuple[Dict[str, Any], ...]]
+
+_EMPTY_MANIFEST: ManifestView = MappingProxyType({})
+
+
+def _stage_entries() -> DefaultDict[str, List[Dict[str, Any]]]:
+    return defaultdict(list)
+
 
 @dataclass
 class ArtifactManager:
     """Tracks artifact directories and manifests for each unit."""
 
     settings: ArtifactSettings
-    _manifest: Dict[str, Dict[str, List[Dict[str, Any]]]] = field(
-        default_factory=dict
+    # unit -> stage -> records; both levels autovivify so ``register`` is a
+    # single append.
+    _manifest: DefaultDict[str, DefaultDict[str, List[Dict[str, Any]]]] = (
+        field(default_factory=lambda: defaultdict(_stage_entries))
+    )
+    # Resolved stage roots and (stage, unit) dirs already created, so
+    # repeated lookups skip the resolve/mkdir syscalls. ``reset`` and
+    # ``reset_all`` forget them in case the directories were removed.
+    _stage_roots: Dict[str, Path] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _created_dirs: Set[Tuple[str, str]] = field(
+        default_factory=set, init=False, repr=False, compare=False
+    )
+    # Read-only manifest views, dropped whenever the unit's entries change.
+    # Filled and invalidated under ``_lock`` so a view built concurrently
+    # with ``register`` can never be stored after its invalidation.
+    _views: Dict[str, ManifestView] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _lock: threading.RLock = field(
+        default_factory=threading.RLock,
+        init=False,
+        repr=False,
+        compare=False,
     )
 
     def __post_init__(self) -> None:
@@ -29,9 +75,13 @@ class ArtifactManager:
     def stage_dir(self, stage: str, unit_id: str) -> Path:
         """Return (and create) a directory for the given stage and unit."""
 
-        base = self._stage_root(stage) / unit_id
-        base.mkdir(parents=True, exist_ok=True)
-        return base
+        with self._lock:
+            base = self._stage_root(stage) / unit_id
+            key = (stage, unit_id)
+            if key not in self._created_dirs:
+                base.mkdir(parents=True, exist_ok=True)
+                self._created_dirs.add(key)
+            return base
 
     def register(
         self,
@@ -43,22 +93,39 @@ class ArtifactManager:
     ) -> None:
         """Record that an artifact was produced for a stage/unit."""
 
-        record: Dict[str, Any] = {"path": str(path)}
+        record: Dict[str, Any] = {"path": os.fspath(path)}
         if metadata:
             record["metadata"] = metadata
-        stage_entries = self._manifest.setdefault(unit_id, {}).setdefault(
-            stage, []
-        )
-        stage_entries.append(record)
+        with self._lock:
+            self._manifest[unit_id][stage].append(record)
+            self._views.pop(unit_id, None)
 
     def manifest_for(self, unit_id: str) -> Dict[str, List[Dict[str, Any]]]:
         """Return a copy of the artifact manifest for a unit."""
 
-        data = self._manifest.get(unit_id, {})
-        return {
-            stage: list(entries)
-            for stage, entries in data.items()
-        }
+        with self._lock:
+            data = self._manifest.get(unit_id, {})
+            return {stage: list(entries) for stage, entries in data.items()}
+
+    def manifest_view(self, unit_id: str) -> ManifestView:
+        """Return a read-only view of the artifact manifest for a unit.
+
+        The view is reused until the unit's manifest changes, so polling is
+        allocation-free; use ``manifest_for`` to get mutable lists.
+        """
+
+        with self._lock:
+            view = self._views.get(unit_id)
+            if view is not None:
+                return view
+            data = self._manifest.get(unit_id)
+            if not data:
+                return _EMPTY_MANIFEST
+            view = MappingProxyType(
+                {stage: tuple(entries) for stage, entries in data.items()}
+            )
+            self._views[unit_id] = view
+            return view
 
     def reset(
         self,
@@ -68,28 +135,43 @@ class ArtifactManager:
     ) -> None:
         """Drop artifacts for the unit, optionally preserving select stages."""
 
-        if not preserve:
-            self._manifest.pop(unit_id, None)
-            return
-        data = self._manifest.get(unit_id)
-        if not data:
-            return
-        preserved: Dict[str, List[Dict[str, Any]]] = {}
-        for stage in preserve:
-            entries = data.get(stage)
-            if entries:
-                preserved[stage] = list(entries)
-        if preserved:
-            self._manifest[unit_id] = preserved
-        else:
-            self._manifest.pop(unit_id, None)
+        with self._lock:
+            self._views.pop(unit_id, None)
+            self._created_dirs = {
+                key for key in self._created_dirs if key[1] != unit_id
+            }
+            if not preserve:
+                self._manifest.pop(unit_id, None)
+                return
+            data = self._manifest.get(unit_id)
+            if not data:
+                return
+            preserved = _stage_entries()
+            for stage in preserve:
+                entries = data.get(stage)
+                if entries:
+                    preserved[stage] = list(entries)
+            if preserved:
+                self._manifest[unit_id] = preserved
+            else:
+                self._manifest.pop(unit_id, None)
 
     def reset_all(self) -> None:
         """Clear manifests for all units."""
 
-        self._manifest.clear()
+        with self._lock:
+            self._manifest.clear()
+            self._views.clear()
+            self._stage_roots.clear()
+            self._created_dirs.clear()
 
     def _stage_root(self, stage: str) -> Path:
+        root = self._stage_roots.get(stage)
+        if root is None:
+            root = self._stage_roots[stage] = self._create_stage_root(stage)
+        return root
+
+    def _create_stage_root(self, stage: str) -> Path:
         if stage == ARTIFACT_STAGE_ANALYZER:
             subdir = self.settings.analyzer_dir
         elif stage == ARTIFACT_STAGE_TRANSPILER:
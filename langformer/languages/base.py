@@ -32,6 +32,10 @@ class LanguagePlugin(ABC):
     ) -> Any:
         """Execute code using provided inputs and return results."""
 
+    def quick_prefix_ok(self, prefix: str) -> bool:
+        """Cheap check on a partial generation; False aborts the stream."""
+        return True
+
     def partition_units(
         self,
         source_code: str,
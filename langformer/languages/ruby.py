@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import os
+import re
 import shutil
 import subprocess
 import tempfile
@@ -12,6 +13,16 @@ from typing import Any, Dict, Optional
 
 from langformer.languages.base import LanguagePlugin
 
+# Partial generations that can never become valid Ruby: a fenced block
+# tagged with another language, or a complete Python-style ``def f(...):``
+# line (Ruby rejects the trailing colon).
+_FENCE_TAG = re.compile(r"\A\s*```[ \t]*([\w+#.-]+)[ \t]*\n")
+_RUBY_FENCE_TAGS = frozenset({"ruby", "rb"})
+_PYTHON_DEF_LINE = re.compile(
+    r"^[ \t]*def[ \t]+\w+[ \t]*\(.*\)[ \t]*(->[^:\n]*)?:[ \t]*$",
+    re.MULTILINE,
+)
+
 
 class LightweightRubyLanguagePlugin(LanguagePlugin):
     """Executes Ruby code via the system `ruby` command."""
@@ -36,6 +47,13 @@ class LightweightRubyLanguagePlugin(LanguagePlugin):
         finally:
             shutil.rmtree(temp_dir, ignore_errors=True)
 
+    def quick_prefix_ok(self, prefix: str) -> bool:
+        fence = _FENCE_TAG.match(prefix)
+        if fence and fence.group(1).lower() not in _RUBY_FENCE_TAGS:
+            return False
+        complete_lines = prefix[: prefix.rfind("\n") + 1]
+        return _PYTHON_DEF_LINE.search(complete_lines) is None
+
     def execute(
         self, code: str, inputs: Optional[Dict[str, Any]] = None
     ) -> Dict[str, Any]:
@@ -0,0 +1,57 @@
+"""Content-addressed caches for provider completions."""
+
+from __future__ import annotations
+
+import hashlib
+import struct
+import threading
+
+from collections import OrderedDict
+from typing import Optional, Protocol
+
+
+class PromptCache(Protocol):
+    """Stores accepted completions keyed by prompt and temperature."""
+
+    def get(self, key: str) -> Optional[str]: ...
+
+    def put(self, key: str, value: str) -> None: ...
+
+
+def prompt_cache_key(prompt: str, temperature: Optional[float]) -> str:
+    """Return the cache key for ``prompt`` sampled at ``temperature``.
+
+    Temperatures are bucketed to two decimals so workers whose schedules
+    land on the same value share entries.
+    """
+
+    digest = hashlib.blake2b(prompt.encode("utf-8"), digest_size=16)
+    bucket = -1.0 if temperature is None else round(temperature, 2)
+    digest.update(struct.pack("<f", bucket))
+    return digest.hexdigest()
+
+
+class InMemoryPromptCache:
+    """Thread-safe LRU ``PromptCache`` shared by parallel workers."""
+
+    def __init__(self, max_entries: int = 256) -> None:
+        self._entries: OrderedDict[str, str] = OrderedDict()
+        self._max_entries = max(1, max_entries)
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+            return value
+
+    def put(self, key: str, value: str) -> None:
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            if len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+
+__all__ = ["InMemoryPromptCache", "PromptCache", "prompt_cache_key"]
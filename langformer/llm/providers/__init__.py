@@ -8,7 +8,7 @@ from __future__ import annotations
 
 import logging
 
-from typing import Any, Dict, Optional, Protocol
+from typing import Any, Dict, List, Optional, Protocol, Sequence
 
 from langformer.llm.providers.anthropic_provider import AnthropicProvider
 from langformer.llm.providers.base import BaseProvider, LLMResponse
@@ -125,3 +125,62 @@ class ProviderAdapter(LLMProvider):
             **extra,
         )
         return response.content or ""
+
+    def supports_batching(self) -> bool:
+        """Whether ``generate_batch`` can serve samples in one request."""
+
+        return self._provider.supports_multiple_completions()
+
+    def generate_batch(
+        self,
+        prompt: str,
+        *,
+        n: int,
+        temperatures: Optional[Sequence[Optional[float]]] = None,
+        **kwargs,
+    ) -> List[str]:
+        """Return ``n`` completions of one prompt, batched per temperature.
+
+        Samples that share a temperature go out as a single multi-choice
+        request when the provider supports it, so the prompt is prefilled
+        once per temperature rather than once per sample.
+        """
+
+        default_temperature = kwargs.pop("temperature", None)
+        temps = (
+            list(temperatures)
+            if temperatures is not None
+            else [default_temperature] * n
+        )
+        if len(temps) != n:
+            raise ValueError("temperatures must have one entry per sample")
+        if not self._provider.supports_multiple_completions():
+            outputs = []
+            for temp in temps:
+                call_kwargs = dict(kwargs)
+                if temp is not None:
+                    call_kwargs["temperature"] = temp
+                outputs.append(self.generate(prompt, **call_kwargs))
+            return outputs
+
+        groups: Dict[Optional[float], List[int]] = {}
+        for idx, temp in enumerate(temps):
+            groups.setdefault(temp, []).append(idx)
+        messages = [{"role": "user", "content": prompt}]
+        extra = {**self._default_kwargs, **kwargs}
+        metadata = extra.pop("metadata", None)
+        batched = [""] * n
+        for temp, idxs in groups.items():
+            call_kwargs = dict(extra)
+            if temp is not None:
+                call_kwargs["temperature"] = temp
+            responses = self._provider.get_multiple_responses(
+                self._model_name,
+                messages,
+                n=len(idxs),
+                metadata=metadata,
+                **call_kwargs,
+            )
+            for idx, response in zip(idxs, responses):
+                batched[idx] = response.content or ""
+        return batched
@@ -82,6 +82,35 @@ class OpenAICompatibleProvider(BaseProvider):
             else None,
         )
 
+    def get_multiple_responses(
+        self,
+        model_name: str,
+        messages: List[Dict[str, str]],
+        n: int = 1,
+        **kwargs: Any,
+    ) -> List[LLMResponse]:
+        # One request with ``n`` choices shares the prompt prefill instead
+        # of paying for it once per sample.
+        if not self.is_available():
+            raise RuntimeError(f"{self.name} client not available")
+        params = self._build_api_params(model_name, messages, n=n, **kwargs)
+        client = self.client
+        if client is None:
+            raise RuntimeError(f"{self.name} client missing")
+        response = client.chat.completions.create(**params)  # type: ignore[attr-defined]
+        usage = (
+            response.usage.dict() if getattr(response, "usage", None) else None
+        )
+        return [
+            LLMResponse(
+                content=choice.message.content,
+                model=model_name,
+                provider=self.name,
+                usage=usage,
+            )
+            for choice in response.choices
+        ]
+
     def _build_api_params(
         self,
         model_name: str,
@@ -37,6 +37,8 @@ class EventAdapter:
         stop_event: Optional[threading.Event] = None,
         on_delta: Optional[Callable[[str], None]] = None,
         client: Optional[Any] = None,
+        prefix_check: Optional[Callable[[str], bool]] = None,
+        prefix_check_chars: int = 512,
     ) -> None:
         self.model = model
         self.store_responses = store_responses
@@ -45,6 +47,10 @@ class EventAdapter:
         self.stop_event = stop_event or threading.Event()
         self.on_delta = on_delta
         self._client = client
+        # Called on the accumulated output every ``prefix_check_chars``
+        # characters (~128 tokens) so doomed generations stop early.
+        self.prefix_check = prefix_check
+        self.prefix_check_chars = prefix_check_chars
         self._buffer: list[str] = []
         self._buffer_bytes = 0
         self._last_flush = time.time()
@@ -113,6 +119,8 @@ class EventAdapter:
         output_parts: list[str] = []
         response_id: Optional[str] = None
         error_msg: Optional[str] = None
+        aborted: Optional[str] = None
+        unchecked_chars = 0
 
         done_flag = threading.Event()
         t = threading.Thread(
@@ -159,6 +167,19 @@ class EventAdapter:
                                 except Exception:
                                     pass
                             data["delta"] = delta
+                            unchecked_chars += len(delta)
+                    if (
+                        self.prefix_check is not None
+                        and unchecked_chars >= self.prefix_check_chars
+                    ):
+                        unchecked_chars = 0
+                        if not self.prefix_check("".join(output_parts)):
+                            aborted = "prefix_syntax_failed"
+                            self._record_event(kind, data)
+                            self._record_event(
+                                "early_abort", {"reason": aborted}
+                            )
+                            break
                     if kind == "response.completed" and hasattr(
                         event, "response"
                     ):
@@ -182,4 +203,5 @@ class EventAdapter:
             "output_text": "".join(output_parts),
             "response_id": response_id,
             "error": error_msg,
+            "aborted": aborted,
         }
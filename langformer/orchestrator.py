@@ -432,7 +432,9 @@ class TranspilationOrchestrator:
         candidate: CandidatePatchSet,
         session: Optional[RunSession],
     ) -> None:
-        manifest = self._artifact_manager.manifest_for(unit_id)
+        # Iterate the cached read-only view; only the session metadata
+        # needs its own dict-of-lists copy.
+        manifest = self._artifact_manager.manifest_view(unit_id)
         if not manifest:
             return
         artifacts_note = candidate.notes.setdefault("artifacts", {})
@@ -442,7 +444,12 @@ class TranspilationOrchestrator:
         if session is not None:
             session.write_metadata(
                 f"{unit_id}_artifacts",
-                {"artifacts": manifest},
+                {
+                    "artifacts": {
+                        stage: list(entries)
+                        for stage, entries in manifest.items()
+                    }
+                },
             )
 
     def _record_verification_artifacts(
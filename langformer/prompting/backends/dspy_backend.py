@@ -2,15 +2,21 @@
 
 from __future__ import annotations
 
-from typing import Callable, Optional
+import importlib.util
+
+from typing import TYPE_CHECKING, Callable, Optional
 
 from langformer.prompting.backends.base import PromptTaskEngine
 from langformer.prompting.types import PromptTaskResult, PromptTaskSpec
 
-try:  # pragma: no cover - optional dependency
+if TYPE_CHECKING:  # pragma: no cover - typing only
     import dspy
-except ImportError:  # pragma: no cover - optional dependency
-    dspy = None
+
+
+def _dspy_available() -> bool:
+    # DSPy drags in litellm and friends; probe for it without importing so
+    # `import langformer` stays cheap when no DSPy engine is used.
+    return importlib.util.find_spec("dspy") is not None
 
 
 class BasicDSPyTranspiler(PromptTaskEngine):
@@ -20,7 +26,7 @@ class BasicDSPyTranspiler(PromptTaskEngine):
         self,
         module_factory: Optional[Callable[[], "dspy.Module"]] = None,
     ) -> None:
-        if module_factory is None and dspy is None:
+        if module_factory is None and not _dspy_available():
             raise RuntimeError(
                 "DSPy is not installed. Install the 'dspy' package to use "
                 "BasicDSPyTranspiler or provide a custom module_factory."
@@ -28,11 +34,13 @@ class BasicDSPyTranspiler(PromptTaskEngine):
         self._module_factory = module_factory or self._default_factory
 
     def _default_factory(self) -> "dspy.Module":
-        if dspy is None:  # pragma: no cover - guarded by __init__
+        try:
+            import dspy
+        except ImportError as exc:  # pragma: no cover - guarded by __init__
             raise RuntimeError(
                 "DSPy is not installed. Install the 'dspy' package to use "
                 "BasicDSPyTranspiler."
-            )
+            ) from exc
 
         class TranspileSignature(dspy.Signature):
             source_code = dspy.InputField()
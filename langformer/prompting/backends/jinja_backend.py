@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import Mapping, MutableMapping
+from typing import Iterable, Mapping, MutableMapping
 
 from langformer.prompting.backends.base import PromptRenderer
 from langformer.prompting.manager import PromptManager
@@ -36,3 +36,14 @@ class JinjaPromptRenderer(PromptRenderer):
             preview=text,
             template=template_name,
         )
+
+    def preload(self, kinds: Iterable[str]) -> None:
+        """Compile the templates mapped to ``kinds``, skipping missing ones."""
+        for kind in kinds:
+            template_name = self._template_map.get(
+                kind, self._default_template
+            )
+            try:
+                self._prompt_manager.preload([template_name])
+            except FileNotFoundError:
+                continue
@@ -132,6 +132,7 @@ def _context_snapshot_fill(ctx: PromptFillContext) -> dict[str, object]:
 
 
 def register_default_fills(registry: PromptFillRegistry) -> None:
-    registry.register(_guidelines_fill)
-    registry.register(_language_prompt_fill)
-    registry.register(_context_snapshot_fill)
+    # The defaults only read the unit's languages and integration context.
+    registry.register(_guidelines_fill, per_attempt=False)
+    registry.register(_language_prompt_fill, per_attempt=False)
+    registry.register(_context_snapshot_fill, per_attempt=False)
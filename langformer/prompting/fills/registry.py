@@ -32,19 +32,44 @@ class PromptFillRegistry:
 
     def __init__(self) -> None:
         self._fills: list[FillFunc] = []
+        self._per_unit: set[FillFunc] = set()
 
-    def register(self, func: FillFunc) -> None:
+    def register(self, func: FillFunc, *, per_attempt: bool = True) -> None:
+        """Register ``func``.
+
+        Pass ``per_attempt=False`` when the fill only reads the unit and
+        integration context, so its output can be reused across retries.
+        """
         if func not in self._fills:
             self._fills.append(func)
+        if per_attempt:
+            self._per_unit.discard(func)
+        else:
+            self._per_unit.add(func)
 
     def unregister(self, func: FillFunc) -> None:
         if func in self._fills:
             self._fills.remove(func)
+        self._per_unit.discard(func)
+
+    def build_payload(
+        self,
+        ctx: PromptFillContext,
+        cache: Optional[Dict[FillFunc, Dict[str, object]]] = None,
+    ) -> Dict[str, object]:
+        """Compose fill outputs in registration order.
 
-    def build_payload(self, ctx: PromptFillContext) -> Dict[str, object]:
+        When ``cache`` is given, contributions of ``per_attempt=False`` fills
+        are stored there and reused on later calls for the same unit.
+        """
         payload: Dict[str, object] = {}
         for func in self._fills:
-            contribution = func(ctx)
+            if cache is not None and func in self._per_unit:
+                contribution = cache.get(func)
+                if contribution is None:
+                    contribution = cache[func] = func(ctx)
+            else:
+                contribution = func(ctx)
             if contribution:
                 payload.update(contribution)
         return payload
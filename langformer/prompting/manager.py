@@ -7,7 +7,7 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Optional, Sequence
+from typing import Iterable, Optional, Sequence
 
 from jinja2 import ChoiceLoader, Environment, FileSystemLoader, Template
 
@@ -21,6 +21,7 @@ class PromptManager:
         *,
         extra_dirs: Optional[Sequence[Path]] = None,
         search_paths: Optional[Sequence[Path]] = None,
+        auto_reload: bool = True,
     ) -> None:
         if templates_dir is not None:
             base_dir = Path(templates_dir)
@@ -52,12 +53,22 @@ class PromptManager:
             loader=ChoiceLoader(loaders),
             trim_blocks=True,
             lstrip_blocks=True,
+            auto_reload=auto_reload,
         )
 
     def render(self, template_name: str, **context) -> str:
         template = self._get_template(template_name)
         return template.render(**context)
 
+    def preload(self, template_names: Iterable[str]) -> None:
+        """Compile templates ahead of the first render.
+
+        Parallel workers would otherwise race to parse the same template on
+        their first attempt; afterwards Jinja's cache serves them all.
+        """
+        for template_name in template_names:
+            self._get_template(template_name)
+
     def list_templates(self) -> list[str]:
         """Return the list of known template filenames."""
         return sorted(set(self._env.list_templates()))
@@ -15,6 +15,14 @@ from pathlib import Path
 from typing import Optional, Tuple
 
 
+def code_digest(code: str) -> str:
+    """SHA-256 digest used to spot duplicate candidates across workers."""
+
+    # Pinned to one algorithm: workers in different environments must agree
+    # on the digest (and the shared-directory filename) for the same code.
+    return hashlib.sha256(code.encode("utf-8")).hexdigest()
+
+
 def register_digest(
     shared_dir: Path, digest: str, worker_id: str, iter_index: int
 ) -> Tuple[str, Optional[str]]:
@@ -51,9 +59,14 @@ class CodeDeduplicator:
     worker_id: str
 
     def register(
-        self, code: str, attempt_index: int
+        self,
+        code: str,
+        attempt_index: int,
+        *,
+        digest: Optional[str] = None,
     ) -> dict[str, Optional[str]]:
-        digest = hashlib.sha256(code.encode("utf-8")).hexdigest()
+        if digest is None:
+            digest = code_digest(code)
         status, owner = register_digest(
             self.shared_dir, digest, self.worker_id, attempt_index
         )
@@ -2,16 +2,54 @@
 
 from __future__ import annotations
 
+import asyncio
+import threading
+
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from typing import Callable, Iterable, Optional, TypeVar
+from typing import Any, Callable, Iterable, Optional, TypeVar
 
 T = TypeVar("T")
 
 
+class LinkedEvent:
+    """Cancel flag private to one exploration, linked to a caller's event.
+
+    ``is_set`` is true once this flag is set or ``parent`` is set, so workers
+    still honour the caller's cancellation, while ``set`` only ever touches
+    the private flag and never cancels the caller's wider scope.
+    """
+
+    def __init__(self, parent: Optional[Any] = None) -> None:
+        self._event = threading.Event()
+        self._parent = parent
+
+    def set(self) -> None:
+        self._event.set()
+
+    def is_set(self) -> bool:
+        if self._event.is_set():
+            return True
+        parent = self._parent
+        return parent is not None and bool(parent.is_set())
+
+
 class ParallelExplorer:
     """Executes callables in parallel and returns the first non-None result."""
 
-    def explore(self, callables: Iterable[Callable[[], T]]) -> Optional[T]:
+    def explore(
+        self,
+        callables: Iterable[Callable[[], T]],
+        *,
+        stop_event: Optional[LinkedEvent] = None,
+    ) -> Optional[T]:
+        """Run ``callables`` and return the first non-None result.
+
+        Queued callables are cancelled once a result arrives, and
+        ``stop_event`` (if given) is set so callables that are already
+        running can stop at their next checkpoint instead of being waited on.
+        It must be private to this call (see ``LinkedEvent``).
+        """
+
         with ThreadPoolExecutor() as executor:
             futures = [executor.submit(func) for func in callables]
             for future in as_completed(futures):
@@ -20,7 +58,48 @@ class ParallelExplorer:
                 except Exception:  # pragma: no cover - best effort resilience
                     continue
                 if result is not None:
+                    if stop_event is not None:
+                        stop_event.set()
                     for pending in futures:
                         pending.cancel()
                     return result
         return None
+
+    async def explore_async(
+        self,
+        callables: Iterable[Callable[[], T]],
+        *,
+        max_concurrency: Optional[int] = None,
+        stop_event: Optional[LinkedEvent] = None,
+    ) -> Optional[T]:
+        """Awaitable ``explore`` for callers already inside an event loop.
+
+        Each callable runs on a worker thread, at most ``max_concurrency`` at
+        a time; once one returns a result the tasks still queued on the
+        semaphore are cancelled.
+        """
+
+        funcs = list(callables)
+        if not funcs:
+            return None
+        semaphore = asyncio.Semaphore(max_concurrency or len(funcs))
+
+        async def _run(func: Callable[[], T]) -> T:
+            async with semaphore:
+                return await asyncio.to_thread(func)
+
+        tasks = [asyncio.ensure_future(_run(func)) for func in funcs]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                try:
+                    result = await next_done
+                except Exception:  # pragma: no cover - best effort
+                    continue
+                if result is not None:
+                    if stop_event is not None:
+                        stop_event.set()
+                    return result
+            return None
+        finally:
+            for task in tasks:
+                task.cancel()
@@ -54,9 +54,13 @@ def run_worker(
         dedup = CodeDeduplicator(Path(shared_dir), worker_label)
 
         def _dedup_handler(
-            code: str, attempt: int, variant_label: Optional[str]
+            code: str,
+            attempt: int,
+            variant_label: Optional[str],
+            *,
+            digest: Optional[str] = None,
         ) -> Dict[str, Any]:
-            return dedup.register(code, attempt)
+            return dedup.register(code, attempt, digest=digest)
 
         dedup_handler = _dedup_handler
     unit = TranspileUnit(
@@ -25,3 +25,52 @@ def test_analyzer_splits_python_functions(llm_config):
     ids = {unit.id for unit in units}
     assert "module:first" in ids
     assert "module:second" in ids
+
+
+def test_analyzer_batch_preserves_order(llm_config):
+    plugin = LightweightPythonLanguagePlugin()
+    analyzer = DefaultAnalyzerAgent(
+        plugin, llm_config, config={"analysis": {"workers": 2}}
+    )
+    items = [(f"value = {idx}\n", f"mod{idx}") for idx in range(5)]
+
+    batches = analyzer.analyze_batch(items)
+
+    assert [units[0].id for units in batches] == [f"mod{i}" for i in range(5)]
+    assert all(units[0].source_ast is not None for units in batches)
+    assert batches[3][0].source_code == "value = 3\n"
+
+
+def test_analyzer_reuses_parse_for_unchanged_source(llm_config):
+    class _CountingPlugin(LightweightPythonLanguagePlugin):
+        calls = 0
+
+        def parse(self, source_code):
+            type(self).calls += 1
+            return super().parse(source_code)
+
+    analyzer = DefaultAnalyzerAgent(_CountingPlugin(), llm_config)
+    source = "def first(x):\n    return x + 1\n"
+
+    first = analyzer.analyze(source, unit_id="a")
+    second = analyzer.analyze(source, unit_id="b")
+
+    assert _CountingPlugin.calls == 1
+    assert first[0].source_ast is second[0].source_ast
+    assert second[0].id == "b"
+
+
+def test_analyzer_skips_partition_below_min_bytes(llm_config):
+    plugin = LightweightPythonLanguagePlugin()
+    analyzer = DefaultAnalyzerAgent(
+        plugin,
+        llm_config,
+        config={
+            "analysis": {"split_functions": True, "partition_min_bytes": 256}
+        },
+    )
+
+    units = analyzer.analyze("def main(x):\n    return x + 1\n", "tiny")
+
+    assert [unit.id for unit in units] == ["tiny"]
+    assert units[0].metadata["analyzer"] == "basic"
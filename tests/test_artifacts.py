@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import shutil
+
 from pathlib import Path
 from types import MethodType
 
@@ -44,6 +46,38 @@ def test_artifact_manager_tracks_manifest(tmp_path: Path) -> None:
     assert manager.manifest_for("unit-1") == {}
 
 
+def test_artifact_manager_manifest_view_is_cached(tmp_path: Path) -> None:
+    manager = ArtifactManager(ArtifactSettings(root=tmp_path / "artifacts"))
+    manager.register(ARTIFACT_STAGE_ANALYZER, "unit-1", tmp_path / "a.json")
+
+    view = manager.manifest_view("unit-1")
+    assert manager.manifest_view("unit-1") is view
+    assert len(view[ARTIFACT_STAGE_ANALYZER]) == 1
+
+    manager.register(ARTIFACT_STAGE_ANALYZER, "unit-1", tmp_path / "b.json")
+    assert len(manager.manifest_view("unit-1")[ARTIFACT_STAGE_ANALYZER]) == 2
+
+    copy = manager.manifest_for("unit-1")
+    copy[ARTIFACT_STAGE_ANALYZER].clear()
+    assert len(manager.manifest_view("unit-1")[ARTIFACT_STAGE_ANALYZER]) == 2
+
+
+def test_artifact_manager_reset_recreates_removed_dirs(
+    tmp_path: Path,
+) -> None:
+    root = tmp_path / "artifacts"
+    manager = ArtifactManager(ArtifactSettings(root=root))
+    unit_dir = manager.stage_dir(ARTIFACT_STAGE_ANALYZER, "unit-1")
+
+    shutil.rmtree(unit_dir)
+    manager.reset("unit-1")
+    assert manager.stage_dir(ARTIFACT_STAGE_ANALYZER, "unit-1").is_dir()
+
+    shutil.rmtree(root)
+    manager.reset_all()
+    assert manager.stage_dir(ARTIFACT_STAGE_ANALYZER, "unit-1").is_dir()
+
+
 def test_artifact_manager_reset_all(tmp_path: Path) -> None:
     settings = ArtifactSettings(root=tmp_path / "artifacts")
     manager = ArtifactManager(settings)
@@ -13,6 +13,9 @@
 # limitations under the License.
 
 
+import subprocess
+import sys
+
 from pathlib import Path
 
 import pytest
@@ -33,6 +36,17 @@ def test_package_imports():
     assert hasattr(langformer, "TranspilationOrchestrator")
 
 
+def test_package_import_defers_orchestrator():
+    """Importing the package alone should not load the orchestrator."""
+    code = (
+        "import sys, langformer; "
+        "assert 'langformer.orchestrator' not in sys.modules; "
+        "langformer.TranspileUnit; "
+        "assert 'langformer.orchestrator' not in sys.modules"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
 def test_orchestrator_transpile_file(tmp_path: Path):
     """Transpile a sample file using the scaffolded orchestrator."""
     orchestrator = TranspilationOrchestrator(
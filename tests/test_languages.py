@@ -51,6 +51,16 @@ main
     assert output["stdout"].strip() == "42"
 
 
+def test_ruby_plugin_quick_prefix_rejects_foreign_code():
+    plugin = LightweightRubyLanguagePlugin()
+
+    assert plugin.quick_prefix_ok("```ruby\nmodule Report\n")
+    assert plugin.quick_prefix_ok("module Report\n  def scale(values)\n")
+    assert plugin.quick_prefix_ok("def scale(values):")  # line incomplete
+    assert not plugin.quick_prefix_ok("```python\ndef scale")
+    assert not plugin.quick_prefix_ok("def scale(values):\n    return")
+
+
 def test_register_language_plugin_round_trip():
     class DummyPlugin(LanguagePlugin):
         language_name = "dummy"
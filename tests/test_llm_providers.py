@@ -85,3 +85,42 @@ def test_load_provider_model_uses_base_url(monkeypatch):
     stub = provider._provider  # type: ignore[attr-defined]
     assert stub.init_kwargs["base_url"] == "http://relay.local"
     assert stub.init_kwargs["api_key_env"] == "CUSTOM_KEY"
+
+
+class _MultiChoiceProvider(_StubProvider):
+    def __init__(self, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self.batches: List[Dict[str, Any]] = []
+
+    def supports_multiple_completions(self) -> bool:
+        return True
+
+    def get_multiple_responses(
+        self,
+        model_name: str,
+        messages: List[Dict[str, str]],
+        n: int = 1,
+        **kwargs: Any,
+    ) -> List[LLMResponse]:
+        self.batches.append({"n": n, "kwargs": kwargs})
+        temp = kwargs.get("temperature")
+        return [
+            LLMResponse(
+                content=f"{temp}:{idx}", model=model_name, provider="s"
+            )
+            for idx in range(n)
+        ]
+
+
+def test_generate_batch_groups_samples_by_temperature(monkeypatch):
+    monkeypatch.setitem(PROVIDER_ALIASES, "multi", _MultiChoiceProvider)
+    provider = load_provider({"provider": "multi", "model": "m"})
+
+    outputs = provider.generate_batch(
+        "prompt", n=3, temperatures=[0.2, 0.6, 0.2]
+    )
+
+    inner = provider._provider  # type: ignore[attr-defined]
+    assert provider.supports_batching()
+    assert [batch["n"] for batch in inner.batches] == [2, 1]
+    assert outputs == ["0.2:0", "0.6:0", "0.2:1"]
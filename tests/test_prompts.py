@@ -86,3 +86,43 @@ def test_prompt_fill_registry_merges_outputs() -> None:
     assert payload["custom_note"] == "attempt_2"
     assert "guidelines" in payload
     assert "context_overview" in payload
+
+
+def test_prompt_fill_cache_reuses_per_unit_fills() -> None:
+    unit = TranspileUnit(
+        id="demo", language="python", source_code="print('hi')"
+    )
+    integration_ctx = IntegrationContext(target_language="ruby")
+    calls: list[int] = []
+
+    def _unit_fill(ctx: PromptFillContext) -> dict[str, object]:
+        calls.append(ctx.attempt)
+        return {"unit_note": ctx.unit.id}
+
+    def _attempt_fill(ctx: PromptFillContext) -> dict[str, object]:
+        return {"attempt_note": f"attempt_{ctx.attempt}"}
+
+    prompt_fills.register(_unit_fill, per_attempt=False)
+    prompt_fills.register(_attempt_fill)
+    cache: dict = {}
+    try:
+        payloads = [
+            prompt_fills.build_payload(
+                PromptFillContext(
+                    unit=unit,
+                    integration_context=integration_ctx,
+                    attempt=attempt,
+                    source_language="python",
+                    target_language="ruby",
+                ),
+                cache=cache,
+            )
+            for attempt in (1, 2)
+        ]
+    finally:
+        prompt_fills.unregister(_unit_fill)
+        prompt_fills.unregister(_attempt_fill)
+
+    assert calls == [1]
+    assert [p["unit_note"] for p in payloads] == ["demo", "demo"]
+    assert payloads[1]["attempt_note"] == "attempt_2"
@@ -1,8 +1,12 @@
 from __future__ import annotations
 
+import asyncio
 import threading
+import time
 
+from dataclasses import replace
 from pathlib import Path
+from types import SimpleNamespace
 from typing import List
 
 import pytest
@@ -14,8 +18,13 @@ from langformer.agents.transpiler import (
 )
 from langformer.exceptions import TranspilationAttemptError
 from langformer.languages.python import LightweightPythonLanguagePlugin
+from langformer.languages.ruby import LightweightRubyLanguagePlugin
+from langformer.llm.cache import InMemoryPromptCache
 from langformer.llm.providers import LLMProvider
+from langformer.logging.event_adapter import EventAdapter
 from langformer.prompting.manager import PromptManager
+from langformer.runtime.dedup import code_digest
+from langformer.runtime.parallel import LinkedEvent, ParallelExplorer
 from langformer.types import (
     IntegrationContext,
     LayoutPlan,
@@ -154,10 +163,15 @@ def test_transpiler_parallel_path_returns_first_success(
         success_keyword="ok", source_plugin=plugin, target_plugin=plugin
     )
 
-    candidate = agent.transpile(_unit(), _ctx(tmp_path), verifier=verifier)
+    caller_event = threading.Event()
+
+    candidate = agent.transpile(
+        _unit(), _ctx(tmp_path), verifier=verifier, cancel_event=caller_event
+    )
 
     assert "ok" in next(iter(candidate.files.values()))
     assert verifier.calls == 1
+    assert not caller_event.is_set()
 
 
 class _DummyProvider(LLMProvider):
@@ -244,6 +258,77 @@ def test_transpiler_falls_back_when_stream_fails(tmp_path: Path) -> None:
     assert candidate.notes["stream"]["error"]
 
 
+class _FakeResponseStream:
+    def __init__(self, deltas: List[str], consumed: List[str]) -> None:
+        self._deltas = deltas
+        self._consumed = consumed
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info) -> bool:
+        return False
+
+    def __iter__(self):
+        for delta in self._deltas:
+            self._consumed.append(delta)
+            yield SimpleNamespace(
+                type="response.output_text.delta", delta=delta
+            )
+        yield SimpleNamespace(
+            type="response.completed", response=SimpleNamespace(id="resp-1")
+        )
+
+
+def test_transpiler_aborts_stream_on_failed_prefix(tmp_path: Path) -> None:
+    python = LightweightPythonLanguagePlugin()
+    ruby = LightweightRubyLanguagePlugin()
+    provider = _DummyProvider()
+    deltas = {
+        1: ["def scale(values):\n", "    return values\n"] * 20,
+        2: ["module Report\n", "  def self.scale(values) = values\n", "end\n"],
+    }
+    consumed: dict[int, List[str]] = {1: [], 2: []}
+
+    def _factory(unit, ctx, attempt, variant_label):
+        client = SimpleNamespace(
+            responses=SimpleNamespace(
+                stream=lambda **params: _FakeResponseStream(
+                    deltas[attempt], consumed[attempt]
+                )
+            )
+        )
+        return EventAdapter(
+            model="m",
+            store_responses=False,
+            timeout_s=5,
+            jsonl_path=tmp_path / f"attempt_{attempt}.jsonl",
+            client=client,
+            prefix_check_chars=16,
+        )
+
+    agent = DefaultTranspilerAgent(
+        python,
+        ruby,
+        llm_config=_llm_config_for(provider),
+        max_retries=2,
+        event_adapter_factory=_factory,
+    )
+    verifier = _Verifier(
+        success_keyword="module Report",
+        source_plugin=python,
+        target_plugin=ruby,
+    )
+
+    candidate = agent.transpile(_unit(), _ctx(tmp_path), verifier=verifier)
+
+    assert candidate.notes["attempt"] == 2
+    assert candidate.notes["stream"]["response_id"] == "resp-1"
+    assert consumed[1] == deltas[1][:1]
+    assert '"early_abort"' in (tmp_path / "attempt_1.jsonl").read_text()
+    assert provider.calls == 0
+
+
 def _dspy_module_factory(output: str):
     class _Module:
         def __call__(self, **kwargs):
@@ -302,6 +387,21 @@ def test_transpiler_skips_duplicate_same_worker(tmp_path: Path) -> None:
     assert "unique" in next(iter(candidate.files.values()))
 
 
+def test_transpiler_passes_digest_to_dedup_handlers(tmp_path: Path) -> None:
+    plugin = LightweightPythonLanguagePlugin()
+    code = "def unique():\n    return 2\n"
+    agent = _make_agent(_StubLLM([code]), plugin, max_retries=1)
+    digests: List[str | None] = []
+
+    def _dedup_handler(code, attempt, variant_label, *, digest=None):
+        digests.append(digest)
+        return {"status": "unique"}
+
+    agent.transpile(_unit(), _ctx(tmp_path), dedup_handler=_dedup_handler)
+
+    assert digests == [code_digest(code)]
+
+
 def test_transpiler_raises_on_cross_worker_dup(tmp_path: Path) -> None:
     plugin = LightweightPythonLanguagePlugin()
     llm = _StubLLM(["def dup():\n    return 0\n"])
@@ -338,3 +438,164 @@ def test_transpiler_checks_cancel_event(tmp_path: Path) -> None:
         agent.transpile(
             _unit(), _ctx(tmp_path), verifier=verifier, cancel_event=event
         )
+
+
+def test_parallel_explorer_signals_running_workers() -> None:
+    caller_event = threading.Event()
+    event = LinkedEvent(caller_event)
+    stopped = threading.Event()
+
+    def slow() -> None:
+        for _ in range(500):
+            if event.is_set():
+                stopped.set()
+                break
+            time.sleep(0.01)
+        return None
+
+    result = ParallelExplorer().explore(
+        [slow, lambda: "done"], stop_event=event
+    )
+
+    assert result == "done"
+    assert stopped.is_set()
+    assert not caller_event.is_set()
+
+
+def test_linked_event_observes_parent() -> None:
+    parent = threading.Event()
+    event = LinkedEvent(parent)
+
+    assert not event.is_set()
+    parent.set()
+    assert event.is_set()
+
+
+def test_transpiler_atranspile_parallel_returns_first_success(
+    tmp_path: Path,
+) -> None:
+    plugin = LightweightPythonLanguagePlugin()
+    llm = _StubLLM([], parallel=True, success_threshold=0.8)
+    agent = _make_agent(
+        llm,
+        plugin,
+        max_retries=2,
+        parallel_workers=2,
+        temperature_range=(0.2, 1.0),
+    )
+    verifier = _Verifier(
+        success_keyword="ok", source_plugin=plugin, target_plugin=plugin
+    )
+
+    candidate = asyncio.run(
+        agent.atranspile(_unit(), _ctx(tmp_path), verifier=verifier)
+    )
+
+    assert "ok" in next(iter(candidate.files.values()))
+    assert verifier.calls == 1
+
+
+class _BatchingLLM(_StubLLM):
+    def __init__(self) -> None:
+        super().__init__(["def fallback():\n    return 0\n"])
+        self.batch_calls: List[List[float]] = []
+
+    def supports_batching(self) -> bool:
+        return True
+
+    def generate_batch(self, prompt: str, *, n, temperatures, **kwargs):
+        self.batch_calls.append(list(temperatures))
+        return [f"def ok_{idx}():\n    return {idx}\n" for idx in range(n)]
+
+
+def test_transpiler_batches_first_parallel_attempt(tmp_path: Path) -> None:
+    plugin = LightweightPythonLanguagePlugin()
+    llm = _BatchingLLM()
+    agent = _make_agent(
+        llm,
+        plugin,
+        max_retries=2,
+        parallel_workers=3,
+        temperature_range=(0.7, 0.7),
+    )
+    verifier = _Verifier(
+        success_keyword="ok_", source_plugin=plugin, target_plugin=plugin
+    )
+    renders: List[object] = []
+    render = agent._prompt_renderer.render
+    agent._prompt_renderer.render = lambda spec: (
+        renders.append(spec) or render(spec)
+    )
+
+    candidate = agent.transpile(_unit(), _ctx(tmp_path), verifier=verifier)
+
+    assert "ok_" in next(iter(candidate.files.values()))
+    assert len(llm.batch_calls) == 1
+    assert len(llm.batch_calls[0]) == 3
+    assert llm._idx == 0
+    assert len(renders) == 1
+
+
+class _BarrierLLM(_BatchingLLM):
+    def __init__(self, parties: int) -> None:
+        super().__init__()
+        self._barrier = threading.Barrier(parties, timeout=5)
+
+    def generate(self, prompt: str, **kwargs) -> str:
+        # Only returns once every worker is generating at the same time.
+        self._barrier.wait()
+        return "def ok():\n    return 42\n"
+
+
+def test_transpiler_workers_share_render_and_generate_concurrently(
+    tmp_path: Path,
+) -> None:
+    plugin = LightweightPythonLanguagePlugin()
+    llm = _BarrierLLM(parties=3)
+    agent = _make_agent(
+        llm,
+        plugin,
+        max_retries=3,
+        parallel_workers=3,
+        temperature_range=(0.2, 1.0),
+    )
+    verifier = _Verifier(
+        success_keyword="ok", source_plugin=plugin, target_plugin=plugin
+    )
+    renders: List[object] = []
+    render = agent._prompt_renderer.render
+    agent._prompt_renderer.render = lambda spec: (
+        renders.append(spec) or render(spec)
+    )
+
+    candidate = asyncio.run(
+        agent.atranspile(_unit(), _ctx(tmp_path), verifier=verifier)
+    )
+
+    assert "ok" in next(iter(candidate.files.values()))
+    assert llm.batch_calls == []
+    assert len(renders) == 1
+
+
+def test_transpiler_prompt_cache_skips_provider(tmp_path: Path) -> None:
+    plugin = LightweightPythonLanguagePlugin()
+    provider = _DummyProvider()
+    agent = _make_agent(
+        provider, plugin, max_retries=1, prompt_cache=InMemoryPromptCache()
+    )
+
+    first = agent.transpile(_unit(), _ctx(tmp_path))
+    second = agent.transpile(_unit(), _ctx(tmp_path))
+
+    assert provider.calls == 1
+    assert first.files == second.files
+    assert second.notes["prompt_result"]["source"] == "prompt_cache"
+
+
+def test_llm_config_compares_by_value() -> None:
+    config = _llm_config_for(_DummyProvider())
+    same = replace(config)
+
+    assert same == config
+    assert hash(same) == hash(config)
+    assert replace(config, prompt_paths=()) != config